@@ -0,0 +1,103 @@
+"""
+Cold-start benchmark: process spawn to first 200 response.
+
+Starts a fresh WSGI server process for every run, polls the given path until
+it answers 200 and reports the elapsed time and the worker's resident set
+size right after that first response. Needs a reachable database configured
+through the usual environment variables.
+
+Usage:
+    python benchmarks/cold_start.py [--runs 5] [--path /issues?page_size=1]
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+SERVER_CODE = (
+    "import sys; "
+    "from wsgiref.simple_server import make_server, WSGIRequestHandler; "
+    "from issue_tracker.wsgi import application; "
+    "WSGIRequestHandler.log_message = lambda *args: None; "
+    "make_server('127.0.0.1', int(sys.argv[1]), application).serve_forever()"
+)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def rss_mb(pid):
+    try:
+        with open(f"/proc/{pid}/status") as status_file:
+            for line in status_file:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def cold_start(path, timeout):
+    port = free_port()
+    env = dict(os.environ)
+    env.setdefault("DJANGO_SETTINGS_MODULE", "issue_tracker.settings")
+    env.setdefault("ALLOWED_HOSTS", "127.0.0.1")
+
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-c", SERVER_CODE, str(port)],
+        cwd=BASE_DIR,
+        env=env,
+    )
+
+    try:
+        url = f"http://127.0.0.1:{port}{path}"
+        while time.perf_counter() - started < timeout:
+            try:
+                with urllib.request.urlopen(url, timeout=timeout) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - started, rss_mb(process.pid)
+            except (urllib.error.URLError, ConnectionError):
+                if process.poll() is not None:
+                    raise RuntimeError("Server process exited before serving.")
+            time.sleep(0.005)
+        raise RuntimeError(f"No 200 response from {url} within {timeout}s.")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--path", default="/issues?page_size=1")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args()
+
+    timings = []
+    for run in range(1, args.runs + 1):
+        elapsed, rss = cold_start(args.path, args.timeout)
+        timings.append(elapsed)
+        rss_text = f"{rss:.1f} MB" if rss is not None else "n/a"
+        print(f"run {run}: first 200 after {elapsed * 1000:.0f} ms, RSS {rss_text}")
+
+    print(
+        f"median {statistics.median(timings) * 1000:.0f} ms, "
+        f"min {min(timings) * 1000:.0f} ms over {len(timings)} runs"
+    )
+
+
+if __name__ == "__main__":
+    main()
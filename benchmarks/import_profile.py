@@ -0,0 +1,65 @@
+"""
+Import-time profile of worker startup.
+
+Runs ``python -X importtime`` on the same imports a WSGI worker performs
+before it can serve (settings, app registry, URLconf) and prints the total
+along with the slowest modules.
+
+Usage:
+    python benchmarks/import_profile.py [--top 25] [--sort self|cumulative]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+STARTUP_CODE = (
+    "import django; django.setup(); "
+    "from django.urls import get_resolver; get_resolver().url_patterns"
+)
+
+
+def profile_imports():
+    env = dict(os.environ)
+    env.setdefault("DJANGO_SETTINGS_MODULE", "issue_tracker.settings")
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP_CODE],
+        cwd=BASE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(self_us), int(cumulative_us), name.rstrip()))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--sort", choices=("self", "cumulative"), default="cumulative")
+    args = parser.parse_args()
+
+    rows = profile_imports()
+    total_us = sum(self_us for self_us, _, _ in rows)
+    key = 0 if args.sort == "self" else 1
+
+    print(f"{len(rows)} modules imported in {total_us / 1000:.1f} ms")
+    print(f"{'self ms':>9} {'cumul ms':>9}  module")
+    for row in sorted(rows, key=lambda row: row[key], reverse=True)[:args.top]:
+        print(f"{row[0] / 1000:9.1f} {row[1] / 1000:9.1f}  {row[2]}")
+
+
+if __name__ == "__main__":
+    main()
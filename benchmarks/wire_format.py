@@ -0,0 +1,90 @@
+"""
+Wire-format benchmark: MessagePack vs JSON for bulk and list payloads.
+
+Builds payloads shaped like a page of GET /issues and a PUT /issues/bulk-status
+body, then compares encoded size and encode/decode time of
+MessagePackRenderer/MessagePackParser against JSONRenderer/JSONParser.
+
+Usage:
+    python benchmarks/wire_format.py [--issues 1000] [--repeat 50]
+"""
+
+import argparse
+import io
+import os
+import sys
+import timeit
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "issue_tracker.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from rest_framework.parsers import JSONParser  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from core.renderers import MessagePackParser, MessagePackRenderer  # noqa: E402
+
+FORMATS = {
+    "json": (JSONRenderer(), JSONParser()),
+    "msgpack": (MessagePackRenderer(), MessagePackParser()),
+}
+
+
+def list_page(count):
+    return {
+        "count": count,
+        "next": None,
+        "previous": None,
+        "results": [
+            {
+                "id": index,
+                "title": f"Issue {index}: login fails on Safari",
+                "description": "Steps to reproduce: open the login page and submit. " * 8,
+                "status": ("open", "in_progress", "resolved", "closed")[index % 4],
+                "assignee": index % 17 or None,
+                "version": index % 5 + 1,
+                "created_at": "2026-01-09T12:08:01.123456Z",
+                "updated_at": "2026-01-10T09:30:00.654321Z",
+            }
+            for index in range(count)
+        ],
+    }
+
+
+def bulk_status(count):
+    return [{"id": index, "status": "closed"} for index in range(count)]
+
+
+def measure(name, payload, repeat):
+    print(f"\n{name}")
+    print(f"{'format':<9} {'bytes':>10} {'encode ms':>10} {'decode ms':>10}")
+
+    for format_name, (renderer, parser) in FORMATS.items():
+        encoded = renderer.render(payload)
+        encode = timeit.timeit(lambda: renderer.render(payload), number=repeat) / repeat
+        decode = timeit.timeit(
+            lambda: parser.parse(io.BytesIO(encoded)), number=repeat
+        ) / repeat
+        print(
+            f"{format_name:<9} {len(encoded):>10} "
+            f"{encode * 1000:>10.3f} {decode * 1000:>10.3f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--issues", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    measure(f"list page ({args.issues} issues)", list_page(args.issues), args.repeat)
+    measure(f"bulk status ({args.issues} items)", bulk_status(args.issues), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import BooleanField, Value
+from django.http import Http404
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+
+from .params import query_flag
+from .models import ArchivedComment, ArchivedIssue, Comment, Issue
+
+ARCHIVED_FIELDS = (
+    'title',
+    'description',
+    'status',
+    'assignee_id',
+    'version',
+    'external_id',
+    'created_at',
+    'updated_at',
+)
+
+
+def include_archived(params):
+    return query_flag(params, "include_archived")
+
+
+# Moves issues closed for more than `older_than_days` into the archive tables,
+# one short transaction per batch. Returns the number of archived issues.
+def archive_closed_issues(older_than_days, batch_size=500, progress=None):
+    cutoff = timezone.now() - timedelta(days=older_than_days)
+    candidates = Issue.objects.filter(status='closed', updated_at__lt=cutoff)
+    total = 0
+
+    while True:
+        with transaction.atomic():
+            issues = list(
+                candidates
+                .select_for_update()
+                .order_by('id')[:batch_size]
+            )
+            if not issues:
+                break
+            archive_batch(issues)
+
+        total += len(issues)
+        if progress:
+            progress(total)
+
+    return total
+
+
+def archive_batch(issues):
+    ids = [issue.id for issue in issues]
+
+    ArchivedIssue.objects.bulk_create([
+        ArchivedIssue(
+            id=issue.id,
+            **{field: getattr(issue, field) for field in ARCHIVED_FIELDS},
+        )
+        for issue in issues
+    ])
+
+    ArchivedComment.objects.bulk_create([
+        ArchivedComment(
+            id=comment.id,
+            issue_id=comment.issue_id,
+            author_id=comment.author_id,
+            body=comment.body,
+            created_at=comment.created_at,
+        )
+        for comment in Comment.objects.filter(issue_id__in=ids)
+    ])
+
+    ArchivedLabels = ArchivedIssue.labels.through
+    ArchivedLabels.objects.bulk_create([
+        ArchivedLabels(archivedissue_id=issue_id, label_id=label_id)
+        for issue_id, label_id in (
+            Issue.labels.through.objects
+            .filter(issue_id__in=ids)
+            .values_list('issue_id', 'label_id')
+        )
+    ])
+
+    Comment.objects.filter(issue_id__in=ids).delete()
+    Issue.objects.filter(id__in=ids).delete()
+
+
+# Live issue by id, falling back to the archive
+def get_issue_or_archived(id, queryset=None, archived_queryset=None):
+    try:
+        return get_object_or_404(
+            queryset if queryset is not None else Issue.objects.all(), id=id
+        )
+    except Http404:
+        return get_object_or_404(
+            archived_queryset if archived_queryset is not None else ArchivedIssue.objects.all(),
+            id=id,
+        )
+
+
+# Keys of live and archived issues ordered newest first, for paginating both
+# tables together without loading full rows.
+def union_by_recency(live, archived):
+    keys = live.order_by().values_list(
+        'created_at', 'id', Value(False, output_field=BooleanField())
+    ).union(
+        archived.order_by().values_list(
+            'created_at', 'id', Value(True, output_field=BooleanField())
+        ),
+        all=True,
+    )
+    return keys.order_by('-created_at', '-id')
+
+
+def hydrate(keys, live, archived):
+    live_ids = [id for _, id, is_archived in keys if not is_archived]
+    archived_ids = [id for _, id, is_archived in keys if is_archived]
+
+    rows = {
+        (False, issue.id): issue for issue in live.filter(id__in=live_ids)
+    }
+    rows.update(
+        ((True, issue.id), issue) for issue in archived.filter(id__in=archived_ids)
+    )
+
+    return [
+        rows[(bool(is_archived), id)] for _, id, is_archived in keys
+        if (bool(is_archived), id) in rows
+    ]
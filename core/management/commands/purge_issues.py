@@ -0,0 +1,48 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.exceptions import ValidationError
+
+from core.purge import PURGE_ACTIONS, PURGE_BATCH_SIZE, purge_issues, purge_queryset
+
+
+class Command(BaseCommand):
+    help = "Delete or close issues matching a filter in bounded batches, each in its own transaction."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--action", choices=sorted(PURGE_ACTIONS), default="delete")
+        parser.add_argument("--status")
+        parser.add_argument("--assignee")
+        parser.add_argument("--label")
+        parser.add_argument("--updated-before", help="YYYY-MM-DD")
+        parser.add_argument("--batch-size", type=int, default=PURGE_BATCH_SIZE)
+        parser.add_argument("--after", type=int, default=0, help="Resume after this issue id.")
+        parser.add_argument("--sleep", type=float, default=0, help="Seconds to pause between batches.")
+
+    def handle(self, *args, **options):
+        try:
+            queryset = purge_queryset({
+                "status": options["status"],
+                "assignee": options["assignee"],
+                "label": options["label"],
+                "updated_before": options["updated_before"],
+            })
+        except ValidationError as exc:
+            raise CommandError(exc.detail)
+
+        def progress(processed, after):
+            self.stdout.write(f"{processed} issues processed (resume with --after {after})")
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+
+        result = purge_issues(
+            queryset,
+            options["action"],
+            batch_size=options["batch_size"],
+            after=options["after"],
+            progress=progress,
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Done: {options['action']} applied to {result['processed']} issues "
+            f"in {result['batches']} batches."
+        ))
@@ -0,0 +1,29 @@
+import logging
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+METRIC_KEY_PREFIX = "metrics:"
+
+
+# Counters live in the configured cache. They are only shared across workers
+# when CACHES points at a shared backend; the default local-memory cache keeps
+# per-process counts that reset on restart.
+def increment(name, amount=1):
+    key = METRIC_KEY_PREFIX + name
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key, amount)
+    except ValueError:
+        cache.set(key, amount, timeout=None)
+    logger.debug("metric %s +%s", name, amount)
+
+
+def get_counts(*names):
+    values = cache.get_many([METRIC_KEY_PREFIX + name for name in names])
+    return {name: values.get(METRIC_KEY_PREFIX + name, 0) for name in names}
+
+
+def rate(part, total):
+    return round(part / total, 4) if total else 0.0
@@ -0,0 +1,45 @@
+# Generated by Django 4.2 on 2026-10-19 16:32
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IssueChange",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("version", models.PositiveIntegerField()),
+                ("fields", models.JSONField(default=list)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "issue",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="changes",
+                        to="core.issue",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="issuechange",
+            constraint=models.UniqueConstraint(
+                fields=("issue", "version"), name="unique_issue_change_version"
+            ),
+        ),
+    ]
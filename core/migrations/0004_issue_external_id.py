@@ -0,0 +1,23 @@
+# Generated by Django 4.2 on 2026-10-19 16:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0003_archive"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="archivedissue",
+            name="external_id",
+            field=models.CharField(blank=True, max_length=255, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name="issue",
+            name="external_id",
+            field=models.CharField(blank=True, max_length=255, null=True, unique=True),
+        ),
+    ]
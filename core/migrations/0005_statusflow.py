@@ -0,0 +1,94 @@
+# Generated by Django 4.2 on 2026-10-19 16:44
+
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+
+
+# Approximate history for existing issues: each issue entered "open" on the
+# day it was created and, unless still open, moved to its current status on
+# the day it was last updated.
+def backfill_status_flow(apps, schema_editor):
+    StatusFlow = apps.get_model("core", "StatusFlow")
+    rows = {}
+
+    def bump(day, status, **counts):
+        row = rows.setdefault((day, status), StatusFlow(day=day, status=status))
+        for field, count in counts.items():
+            setattr(row, field, getattr(row, field) + count)
+
+    for model_name in ("Issue", "ArchivedIssue"):
+        model = apps.get_model("core", model_name)
+
+        created = (
+            model.objects.values(flow_day=TruncDate("created_at"))
+            .annotate(total=Count("id"))
+            .order_by()
+        )
+        for row in created:
+            bump(row["flow_day"], "open", entered=row["total"], created=row["total"])
+
+        moved = (
+            model.objects.exclude(status="open")
+            .values("status", flow_day=TruncDate("updated_at"))
+            .annotate(total=Count("id"))
+            .order_by()
+        )
+        for row in moved:
+            bump(row["flow_day"], "open", exited=row["total"])
+            bump(
+                row["flow_day"],
+                row["status"],
+                entered=row["total"],
+                resolved=row["total"] if row["status"] in ("resolved", "closed") else 0,
+            )
+
+    StatusFlow.objects.bulk_create(rows.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0004_issue_external_id"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StatusFlow",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("open", "Open"),
+                            ("in_progress", "In Progress"),
+                            ("resolved", "Resolved"),
+                            ("closed", "Closed"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("entered", models.PositiveIntegerField(default=0)),
+                ("exited", models.PositiveIntegerField(default=0)),
+                ("created", models.PositiveIntegerField(default=0)),
+                ("resolved", models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="statusflow",
+            constraint=models.UniqueConstraint(
+                fields=("day", "status"), name="unique_status_flow_day"
+            ),
+        ),
+        migrations.RunPython(backfill_status_flow, migrations.RunPython.noop),
+    ]
@@ -42,6 +42,13 @@ class Issue(models.Model):
 
     version = models.PositiveIntegerField(default=1)
 
+    external_id = models.CharField(
+        max_length=255,
+        null=True,
+        blank=True,
+        unique=True
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -67,3 +74,119 @@ class Comment(models.Model):
 
     def __str__(self):
         return f"Comment by {self.author} on {self.issue}"
+
+
+class IssueChange(models.Model):
+    issue = models.ForeignKey(
+        Issue,
+        on_delete=models.CASCADE,
+        related_name='changes'
+    )
+
+    version = models.PositiveIntegerField()
+    fields = models.JSONField(default=list)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['issue', 'version'],
+                name='unique_issue_change_version',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.issue} v{self.version}: {', '.join(self.fields)}"
+
+
+# Closed issues moved out of the hot Issue table; ids are preserved so
+# /issues/{id} can read through to the archive.
+class ArchivedIssue(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+
+    title = models.CharField(max_length=255)
+    description = models.TextField()
+
+    status = models.CharField(
+        max_length=20,
+        choices=Issue.STATUS_CHOICES,
+    )
+
+    assignee = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='archived_issues'
+    )
+
+    labels = models.ManyToManyField(
+        Label,
+        related_name='archived_issues',
+        blank=True
+    )
+
+    version = models.PositiveIntegerField()
+
+    external_id = models.CharField(
+        max_length=255,
+        null=True,
+        blank=True,
+        unique=True
+    )
+
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.title
+
+
+class ArchivedComment(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+
+    issue = models.ForeignKey(
+        ArchivedIssue,
+        on_delete=models.CASCADE,
+        related_name='comments'
+    )
+
+    author = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='archived_comments'
+    )
+
+    body = models.TextField()
+    created_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"Comment by {self.author} on {self.issue}"
+
+
+# Per-day, per-status transition counts, maintained on every status change
+# so flow and burndown charts read O(days) rows instead of scanning issues.
+class StatusFlow(models.Model):
+    day = models.DateField()
+
+    status = models.CharField(
+        max_length=20,
+        choices=Issue.STATUS_CHOICES,
+    )
+
+    entered = models.PositiveIntegerField(default=0)
+    exited = models.PositiveIntegerField(default=0)
+    created = models.PositiveIntegerField(default=0)
+    resolved = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['day', 'status'],
+                name='unique_status_flow_day',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.day} {self.status}: +{self.entered} -{self.exited}"
@@ -0,0 +1,12 @@
+from urllib.parse import urlencode
+
+TRUE_VALUES = ("1", "true", "yes")
+
+
+def query_flag(params, name):
+    return str(params.get(name, "")).lower() in TRUE_VALUES
+
+
+# Stable cache key for a named result computed from query parameters
+def cache_key(name, params):
+    return f"report:{name}:{urlencode(sorted(params.items()))}"
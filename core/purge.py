@@ -0,0 +1,141 @@
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from rest_framework import generics, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from .filters import ISSUE_FILTERS, filter_issues, validate_issue_filters
+from .flow import record_transitions
+from .models import Comment, Issue, IssueChange
+from .reports import parse_date_param, start_of_day
+
+PURGE_BATCH_SIZE = 500
+MAX_PURGE_BATCH_SIZE = 5000
+
+
+# Issue filters accepted by bulk delete/close, plus updated_before (a date)
+def purge_queryset(filters):
+    filters = {name: value for name, value in filters.items() if value not in (None, "")}
+    if not filters:
+        raise ValidationError({"filter": ["At least one filter is required."]})
+
+    unknown = set(filters) - set(ISSUE_FILTERS) - {"updated_before"}
+    if unknown:
+        raise ValidationError({"filter": [f"Unknown filter(s): {', '.join(sorted(unknown))}."]})
+
+    validate_issue_filters(filters)
+    if not isinstance(filters.get("updated_before", ""), str):
+        raise ValidationError({"updated_before": ["Expected a date in YYYY-MM-DD format."]})
+
+    queryset = filter_issues(Issue.objects.all(), filters)
+
+    updated_before = parse_date_param(filters, "updated_before")
+    if updated_before:
+        queryset = queryset.filter(updated_at__lt=start_of_day(updated_before))
+
+    return queryset
+
+
+# Batch actions re-apply the purge filter to the locked ids, so a row that
+# stopped matching since it was selected is left alone. Each returns the
+# number of issues that still matched.
+def delete_batch(queryset, ids):
+    rows = list(queryset.filter(id__in=ids).values_list("id", "status"))
+    ids = [id for id, _ in rows]
+
+    record_transitions((status, None) for _, status in rows)
+    Comment.objects.filter(issue_id__in=ids).delete()
+    IssueChange.objects.filter(issue_id__in=ids).delete()
+    Issue.labels.through.objects.filter(issue_id__in=ids).delete()
+    Issue.objects.filter(id__in=ids).delete()
+    return len(rows)
+
+
+def close_batch(queryset, ids):
+    rows = list(queryset.filter(id__in=ids).values_list("id", "version", "status"))
+    open_issues = [row for row in rows if row[2] != "closed"]
+
+    Issue.objects.filter(id__in=[id for id, _, _ in open_issues]).update(
+        status="closed",
+        version=F("version") + 1,
+        updated_at=timezone.now(),
+    )
+    IssueChange.objects.bulk_create([
+        IssueChange(issue_id=id, version=version + 1, fields=["status"])
+        for id, version, _ in open_issues
+    ])
+    record_transitions((status, "closed") for _, _, status in open_issues)
+    return len(rows)
+
+
+PURGE_ACTIONS = {
+    "delete": delete_batch,
+    "close": close_batch,
+}
+
+
+# Walks the matching issues in id order, one short transaction per batch.
+# Each batch locks only its issue rows (FOR UPDATE OF), not joined labels.
+# `after` is the resume cursor: the last id handled by a previous run.
+def purge_issues(queryset, action, batch_size=PURGE_BATCH_SIZE, after=0,
+                 max_batches=None, progress=None):
+    apply_batch = PURGE_ACTIONS[action]
+    processed = 0
+    batches = 0
+
+    while max_batches is None or batches < max_batches:
+        with transaction.atomic():
+            ids = list(
+                queryset
+                .select_for_update(of=("self",))
+                .filter(id__gt=after)
+                .order_by("id")
+                .values_list("id", flat=True)[:batch_size]
+            )
+            if not ids:
+                return {"processed": processed, "batches": batches, "next_after": None, "done": True}
+            matched = apply_batch(queryset, ids)
+
+        after = ids[-1]
+        processed += matched
+        batches += 1
+        if progress:
+            progress(processed, after)
+
+    return {"processed": processed, "batches": batches, "next_after": after, "done": False}
+
+
+# POST /issues/bulk-delete and /issues/bulk-close — chunked, resumable purge
+class BulkIssuePurgeView(generics.GenericAPIView):
+    queryset = Issue.objects.none()
+    purge_action = None
+    max_batches = 10
+
+    def post(self, request):
+        data = request.data if isinstance(request.data, dict) else {}
+
+        try:
+            batch_size = int(data.get("batch_size", PURGE_BATCH_SIZE))
+            after = int(data.get("after", 0))
+        except (TypeError, ValueError):
+            raise ValidationError({"detail": ["batch_size and after must be integers."]})
+
+        if not 1 <= batch_size <= MAX_PURGE_BATCH_SIZE:
+            raise ValidationError(
+                {"batch_size": [f"Expected a value between 1 and {MAX_PURGE_BATCH_SIZE}."]}
+            )
+
+        filters = data.get("filter")
+        if not isinstance(filters, dict):
+            raise ValidationError({"filter": ["Expected an object of issue filters."]})
+
+        result = purge_issues(
+            purge_queryset(filters),
+            self.purge_action,
+            batch_size=batch_size,
+            after=after,
+            max_batches=self.max_batches,
+        )
+
+        return Response({"action": self.purge_action, **result}, status=status.HTTP_200_OK)
@@ -0,0 +1,37 @@
+import msgpack
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+_encoder = JSONEncoder()
+
+
+# Types msgpack cannot pack natively (datetimes, decimals, UUIDs, ...) are
+# converted the same way JSONRenderer converts them.
+def _default(obj):
+    return _encoder.default(obj)
+
+
+# Compact binary alternative to JSON for bulk and list payloads,
+# negotiated through Accept / Content-Type: application/msgpack
+class MessagePackRenderer(BaseRenderer):
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=_default, use_bin_type=True)
+
+
+class MessagePackParser(BaseParser):
+    media_type = "application/msgpack"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        except ValueError as exc:
+            raise ParseError(f"MessagePack parse error - {exc}")
@@ -0,0 +1,123 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from rest_framework.exceptions import Throttled
+
+from .params import cache_key
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    "TTL": 30,
+    "MAX_STALE": 300,
+    "WORKERS": 2,
+    "BACKGROUND_REFRESH": True,
+    "LOCK_TIMEOUT": 60,
+    "WAIT": 5,
+    "POLL_INTERVAL": 0.05,
+}
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_config():
+    return {**DEFAULTS, **getattr(settings, "REPORT_CACHE", {})}
+
+
+def get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=get_config()["WORKERS"],
+                thread_name_prefix="report-refresh",
+            )
+    return _executor
+
+
+def store(key, data, config):
+    entry = {"data": data, "computed_at": time.time()}
+    cache.set(key, entry, timeout=config["TTL"] + config["MAX_STALE"])
+    return entry
+
+
+def lock_key(key):
+    return key + ":refreshing"
+
+
+def acquire(key, config):
+    return cache.add(lock_key(key), True, timeout=config["LOCK_TIMEOUT"])
+
+
+def refresh(key, compute, config):
+    try:
+        store(key, compute(), config)
+    except Exception:
+        logger.exception("Refresh of %s failed", key)
+    finally:
+        cache.delete(lock_key(key))
+
+
+def background_refresh(key, compute, config):
+    try:
+        refresh(key, compute, config)
+    finally:
+        connections.close_all()
+
+
+# Computes the report when no usable entry exists (a miss or a forced refresh).
+# Only the caller holding the lock computes; the others wait up to WAIT
+# seconds for its result, then are throttled.
+def compute_once(key, compute, config, newer_than=None):
+    if acquire(key, config):
+        try:
+            return store(key, compute(), config)
+        finally:
+            cache.delete(lock_key(key))
+
+    deadline = time.monotonic() + config["WAIT"]
+    while time.monotonic() < deadline:
+        time.sleep(config["POLL_INTERVAL"])
+        entry = cache.get(key)
+        if entry is not None and (newer_than is None or entry["computed_at"] >= newer_than):
+            return entry
+
+    raise Throttled(
+        wait=max(config["WAIT"], 1),
+        detail="Report is being computed; retry shortly.",
+    )
+
+
+# Stale-while-revalidate lookup. Fresh entries are served as is; a stale entry
+# is served while exactly one caller (guarded by an atomic cache.add) refreshes
+# it in the background. Misses and forced refreshes go through the same lock.
+# Returns (data, state, computed_at).
+def get_report(name, params, compute, force=False):
+    config = get_config()
+    key = cache_key(name, params)
+
+    if force:
+        entry = compute_once(key, compute, config, newer_than=time.time())
+        return entry["data"], "REFRESH", entry["computed_at"]
+
+    entry = cache.get(key)
+    if entry is None:
+        entry = compute_once(key, compute, config)
+        return entry["data"], "MISS", entry["computed_at"]
+
+    if time.time() - entry["computed_at"] <= config["TTL"]:
+        return entry["data"], "HIT", entry["computed_at"]
+
+    if acquire(key, config):
+        if config["BACKGROUND_REFRESH"]:
+            get_executor().submit(background_refresh, key, compute, config)
+        else:
+            refresh(key, compute, config)
+
+    return entry["data"], "STALE", entry["computed_at"]
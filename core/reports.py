@@ -0,0 +1,309 @@
+import time
+from datetime import datetime, timedelta
+
+from rest_framework import generics, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from django.db.models import Count, Avg, F, ExpressionWrapper, DateField, DurationField, Q, Sum
+from django.db.models.functions import Trunc
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from django.utils.http import http_date
+
+from .models import ArchivedIssue, Issue, StatusFlow
+from .archive import include_archived
+from .params import query_flag
+from .report_cache import get_report
+from . import metrics
+
+
+# Serves build_report() through the stale-while-revalidate report cache;
+# ?refresh=true forces a synchronous recompute. Only the parameters listed in
+# report_params reach build_report() and the cache key, so cache-busters and
+# unknown parameters share the same entry.
+class CachedReportMixin:
+    report_name = None
+    report_params = ()
+
+    def get(self, request):
+        params = {
+            name: request.query_params[name]
+            for name in self.report_params
+            if request.query_params.get(name)
+        }
+
+        data, state, computed_at = get_report(
+            self.report_name,
+            params,
+            lambda: self.build_report(params),
+            force=query_flag(request.query_params, "refresh"),
+        )
+
+        response = Response(data, status=status.HTTP_200_OK)
+        response["X-Report-Cache"] = state
+        response["X-Report-Computed-At"] = http_date(computed_at)
+        response["Age"] = str(max(0, int(time.time() - computed_at)))
+        return response
+
+
+def parse_date_param(params, name):
+    value = params.get(name)
+    if not value:
+        return None
+    try:
+        parsed = parse_date(value)
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise ValidationError({name: ["Expected a date in YYYY-MM-DD format."]})
+    return parsed
+
+
+def start_of_day(day):
+    return timezone.make_aware(datetime.combine(day, datetime.min.time()))
+
+
+# GET /reports/top-assignees — issue counts per assignee with usernames and a
+# per-status breakdown; supports limit, status and from/to (created date)
+class TopAssigneesReportView(CachedReportMixin, generics.GenericAPIView):
+    queryset = Issue.objects.none()
+    report_name = "top-assignees"
+    report_params = ("limit", "status", "from", "to", "include_archived")
+    max_limit = 1000
+
+    def build_report(self, params):
+        limit = self.parse_limit(params)
+        filters = self.parse_filters(params)
+
+        querysets = [Issue.objects.all()]
+        if include_archived(params):
+            querysets.append(ArchivedIssue.objects.all())
+
+        statuses = [value for value, _ in Issue.STATUS_CHOICES]
+        breakdown = {
+            f"status_{value}": Count("id", filter=Q(status=value))
+            for value in statuses
+        }
+
+        rows = {}
+        for queryset in querysets:
+            grouped = (
+                queryset
+                .filter(assignee__isnull=False, **filters)
+                .values("assignee", "assignee__username")
+                .annotate(issue_count=Count("id"), **breakdown)
+                .order_by("-issue_count", "assignee")
+            )
+            if limit and len(querysets) == 1:
+                grouped = grouped[:limit]
+
+            for row in grouped:
+                entry = rows.setdefault(row["assignee"], {
+                    "assignee": row["assignee"],
+                    "username": row["assignee__username"],
+                    "issue_count": 0,
+                    "by_status": dict.fromkeys(statuses, 0),
+                })
+                entry["issue_count"] += row["issue_count"]
+                for value in statuses:
+                    entry["by_status"][value] += row[f"status_{value}"]
+
+        data = sorted(
+            rows.values(),
+            key=lambda entry: (-entry["issue_count"], entry["assignee"]),
+        )
+        return data[:limit] if limit else data
+
+    def parse_limit(self, params):
+        if not params.get("limit"):
+            return None
+        try:
+            limit = int(params["limit"])
+        except ValueError:
+            limit = 0
+        if not 1 <= limit <= self.max_limit:
+            raise ValidationError(
+                {"limit": [f"Expected an integer between 1 and {self.max_limit}."]}
+            )
+        return limit
+
+    def parse_filters(self, params):
+        filters = {}
+
+        status_param = params.get("status")
+        if status_param:
+            if status_param not in dict(Issue.STATUS_CHOICES):
+                raise ValidationError({"status": [f"Invalid status '{status_param}'."]})
+            filters["status"] = status_param
+
+        date_from = parse_date_param(params, "from")
+        date_to = parse_date_param(params, "to")
+        if date_from:
+            filters["created_at__gte"] = start_of_day(date_from)
+        if date_to:
+            filters["created_at__lt"] = start_of_day(date_to + timedelta(days=1))
+
+        return filters
+
+
+# GET /reports/latency — average resolution time for resolved/closed issues
+class IssueLatencyReportView(CachedReportMixin, generics.GenericAPIView):
+    queryset = Issue.objects.none()
+    report_name = "latency"
+    report_params = ("include_archived",)
+
+    def build_report(self, params):
+        querysets = [Issue.objects.all()]
+        if include_archived(params):
+            querysets.append(ArchivedIssue.objects.all())
+
+        latency_expression = ExpressionWrapper(
+            F("updated_at") - F("created_at"),
+            output_field=DurationField()
+        )
+
+        total_latency = None
+        total_count = 0
+        for queryset in querysets:
+            result = queryset.filter(
+                status__in=["resolved", "closed"]
+            ).aggregate(
+                average_latency=Avg(latency_expression),
+                resolved_count=Count("id"),
+            )
+            if result["average_latency"] is None:
+                continue
+
+            latency = result["average_latency"] * result["resolved_count"]
+            total_latency = latency if total_latency is None else total_latency + latency
+            total_count += result["resolved_count"]
+
+        return {
+            "average_resolution_time": total_latency / total_count if total_count else None
+        }
+
+
+def period_starts(date_from, date_to, group_by):
+    if group_by == "week":
+        current = date_from - timedelta(days=date_from.weekday())
+    elif group_by == "month":
+        current = date_from.replace(day=1)
+    else:
+        current = date_from
+
+    while current <= date_to:
+        yield current
+        if group_by == "week":
+            current += timedelta(days=7)
+        elif group_by == "month":
+            current = (current + timedelta(days=32)).replace(day=1)
+        else:
+            current += timedelta(days=1)
+
+
+# GET /reports/flow — created/resolved and per-status flow per day, week or
+# month, read from the incrementally maintained StatusFlow table
+class FlowReportView(CachedReportMixin, generics.GenericAPIView):
+    queryset = Issue.objects.none()
+    report_name = "flow"
+    report_params = ("from", "to", "group_by")
+    groupings = ("day", "week", "month")
+    default_days = 30
+    max_days = 3660
+
+    def build_report(self, params):
+        group_by = params.get("group_by") or "day"
+        if group_by not in self.groupings:
+            raise ValidationError(
+                {"group_by": [f"Expected one of: {', '.join(self.groupings)}."]}
+            )
+
+        date_to = parse_date_param(params, "to") or timezone.localdate()
+        date_from = (
+            parse_date_param(params, "from")
+            or date_to - timedelta(days=self.default_days - 1)
+        )
+        if date_from > date_to:
+            raise ValidationError({"from": ["from must not be after to."]})
+        if (date_to - date_from).days >= self.max_days:
+            raise ValidationError({"from": [f"The range may span at most {self.max_days} days."]})
+
+        statuses = [value for value, _ in Issue.STATUS_CHOICES]
+
+        # Issues in each status at the start of the range
+        totals = dict.fromkeys(statuses, 0)
+        totals.update(
+            StatusFlow.objects
+            .filter(day__lt=date_from)
+            .values_list("status")
+            .annotate(total=Sum(F("entered") - F("exited")))
+            .order_by()
+        )
+
+        grouped = (
+            StatusFlow.objects
+            .filter(day__range=(date_from, date_to))
+            .annotate(period=Trunc("day", group_by, output_field=DateField()))
+            .values_list("period", "status")
+            .annotate(
+                total_entered=Sum("entered"),
+                total_exited=Sum("exited"),
+                total_created=Sum("created"),
+                total_resolved=Sum("resolved"),
+            )
+            .order_by()
+        )
+        flows = {
+            (period, status): (entered, exited, created, resolved)
+            for period, status, entered, exited, created, resolved in grouped
+        }
+
+        results = []
+        for period in period_starts(date_from, date_to, group_by):
+            entry = {"period": period, "created": 0, "resolved": 0, "statuses": {}}
+
+            for status_value in statuses:
+                entered, exited, created, resolved = flows.get(
+                    (period, status_value), (0, 0, 0, 0)
+                )
+                totals[status_value] += entered - exited
+                entry["created"] += created
+                entry["resolved"] += resolved
+                entry["statuses"][status_value] = {
+                    "entered": entered,
+                    "exited": exited,
+                    "total": totals[status_value],
+                }
+
+            results.append(entry)
+
+        return {
+            "from": date_from,
+            "to": date_to,
+            "group_by": group_by,
+            "results": results,
+        }
+
+
+# GET /reports/concurrency — PATCH merge and conflict rates
+class ConcurrencyReportView(generics.GenericAPIView):
+    queryset = Issue.objects.none()
+
+    def get(self, request):
+        counts = metrics.get_counts(
+            "issue_patch.total",
+            "issue_patch.merged",
+            "issue_patch.conflict",
+        )
+        total = counts["issue_patch.total"]
+
+        return Response(
+            {
+                "patches": total,
+                "merged": counts["issue_patch.merged"],
+                "conflicts": counts["issue_patch.conflict"],
+                "merge_rate": metrics.rate(counts["issue_patch.merged"], total),
+                "conflict_rate": metrics.rate(counts["issue_patch.conflict"], total),
+            },
+            status=status.HTTP_200_OK,
+        )
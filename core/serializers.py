@@ -2,8 +2,28 @@ from rest_framework import serializers
 from .models import Issue, Comment, Label
 
 
+# Narrows rendered fields to a requested subset and adds opt-in expansions
+class SparseFieldsMixin:
+    expandable_fields = {}
+
+    def __init__(self, *args, fields=None, expand=(), **kwargs):
+        super().__init__(*args, **kwargs)
+
+        for name in expand:
+            self.fields[name] = self.expandable_fields[name]()
+
+        if fields is not None:
+            for name in set(self.fields) - set(fields) - set(expand):
+                self.fields.pop(name)
+
+
 # Base serializer for creating and listing issues
-class IssueSerializer(serializers.ModelSerializer):
+class IssueSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    expandable_fields = {
+        'labels': lambda: LabelSerializer(many=True, read_only=True),
+        'comment_count': lambda: serializers.IntegerField(read_only=True),
+    }
+
     class Meta:
         model = Issue
         fields = [
@@ -57,7 +77,11 @@ class LabelSerializer(serializers.ModelSerializer):
 
 
 # Detailed issue serializer including comments and labels
-class IssueDetailSerializer(serializers.ModelSerializer):
+class IssueDetailSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    expandable_fields = {
+        'comment_count': lambda: serializers.IntegerField(read_only=True),
+    }
+
     comments = CommentSerializer(many=True, read_only=True)
     labels = LabelSerializer(many=True, read_only=True)
 
@@ -102,6 +126,16 @@ class IssueCSVRowSerializer(serializers.Serializer):
         required=True
     )
     assignee = serializers.IntegerField(required=False, allow_null=True)
+    external_id = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        max_length=255
+    )
+
+    def to_internal_value(self, data):
+        if data.get("assignee") == "":
+            data = {**data, "assignee": None}
+        return super().to_internal_value(data)
 
     def validate_title(self, value):
         if not value.strip():
@@ -0,0 +1,84 @@
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APIClient
+from core.models import ArchivedIssue, Comment, Issue, Label
+
+pytestmark = pytest.mark.django_db
+
+
+def make_closed_issue(title, days_ago):
+    issue = Issue.objects.create(title=title, description="Desc", status="closed")
+    Issue.objects.filter(id=issue.id).update(
+        updated_at=timezone.now() - timedelta(days=days_ago)
+    )
+    return issue
+
+
+def test_archive_moves_old_closed_issues_with_comments_and_labels():
+    author = User.objects.create(username="archiver")
+
+    old = make_closed_issue("Old", days_ago=120)
+    old.labels.add(Label.objects.create(name="bug"))
+    Comment.objects.create(issue=old, author=author, body="Done")
+    recent = make_closed_issue("Recent", days_ago=5)
+
+    call_command("archive_closed_issues", days=90, batch_size=1)
+
+    assert list(Issue.objects.values_list("id", flat=True)) == [recent.id]
+    archived = ArchivedIssue.objects.get(id=old.id)
+    assert list(archived.labels.values_list("name", flat=True)) == ["bug"]
+    assert archived.comments.get().body == "Done"
+
+
+def test_archived_issue_reads_through_detail_and_timeline():
+    client = APIClient()
+    issue = make_closed_issue("Archived", days_ago=120)
+
+    call_command("archive_closed_issues", days=90)
+
+    response = client.get(f"/issues/{issue.id}")
+    assert response.status_code == 200
+    assert response.data["title"] == "Archived"
+
+    response = client.get(f"/issues/{issue.id}/timeline")
+    assert response.status_code == 200
+
+
+def test_list_include_archived():
+    client = APIClient()
+    make_closed_issue("Archived", days_ago=120)
+    Issue.objects.create(title="Live", status="open")
+
+    call_command("archive_closed_issues", days=90)
+
+    response = client.get("/issues")
+    assert [issue["title"] for issue in response.data["results"]] == ["Live"]
+
+    response = client.get("/issues?include_archived=true")
+    assert response.data["count"] == 2
+    assert {issue["title"] for issue in response.data["results"]} == {"Live", "Archived"}
+
+    response = client.get("/reports/latency?include_archived=true")
+    assert response.status_code == 200
+    assert response.data["average_resolution_time"] is not None
+
+
+def test_comment_count_expansion_counts_archived_comments():
+    client = APIClient()
+    author = User.objects.create(username="counter")
+    issue = make_closed_issue("Archived", days_ago=120)
+    Comment.objects.create(issue=issue, author=author, body="Kept")
+    live = Issue.objects.create(title="Live", description="Desc", status="open")
+    Comment.objects.create(issue=live, author=author, body="Live comment")
+    call_command("archive_closed_issues", days=90)
+
+    response = client.get(f"/issues/{issue.id}?expand=comment_count")
+    assert response.data["comment_count"] == 1
+
+    response = client.get("/issues?include_archived=true&expand=comment_count")
+    counts = {row["id"]: row["comment_count"] for row in response.data["results"]}
+    assert counts == {issue.id: 1, live.id: 1}
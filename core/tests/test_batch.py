@@ -0,0 +1,101 @@
+import pytest
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+from core.models import Comment, Issue, Label, StatusFlow
+
+pytestmark = pytest.mark.django_db
+
+
+def test_batch_creates_issue_with_labels_and_comment():
+    client = APIClient()
+    author = User.objects.create(username="batcher")
+
+    response = client.post(
+        "/batch",
+        {
+            "operations": [
+                {
+                    "op": "create_issue",
+                    "ref": "new",
+                    "data": {"title": "Batch issue", "description": "Desc", "status": "open"},
+                },
+                {"op": "replace_labels", "issue": "$new", "data": [{"name": "bug"}]},
+                {"op": "add_comment", "issue": "$new", "data": {"body": "First", "author": author.id}},
+            ]
+        },
+        format="json",
+    )
+
+    assert response.status_code == 200
+    results = response.data["results"]
+    assert [result["status"] for result in results] == [201, 200, 201]
+
+    issue = Issue.objects.get(id=results[0]["data"]["id"])
+    assert list(issue.labels.values_list("name", flat=True)) == ["bug"]
+    assert issue.comments.count() == 1
+
+
+def test_batch_rolls_back_on_failed_operation():
+    client = APIClient()
+
+    response = client.post(
+        "/batch",
+        {
+            "operations": [
+                {
+                    "op": "create_issue",
+                    "ref": "new",
+                    "data": {"title": "Rolled back", "description": "Desc", "status": "open"},
+                },
+                {"op": "replace_labels", "issue": "$new", "data": [{"name": "bug"}]},
+                {"op": "add_comment", "issue": "$missing", "data": {"body": "Lost"}},
+            ]
+        },
+        format="json",
+    )
+
+    assert response.status_code == 400
+    assert response.data["failed_operation"] == 2
+    assert Issue.objects.count() == 0
+    assert Label.objects.count() == 0
+    assert Comment.objects.count() == 0
+
+
+def test_batch_rejects_non_list_label_data():
+    issue = Issue.objects.create(title="Labelled", status="open")
+
+    response = APIClient().post(
+        "/batch",
+        {"operations": [{"op": "replace_labels", "issue": issue.id, "data": 5}]},
+        format="json",
+    )
+
+    assert response.status_code == 400
+    assert response.data["failed_operation"] == 0
+
+
+@pytest.mark.parametrize("reference", [[1], {"a": 1}, True, "1.5"])
+def test_batch_rejects_malformed_issue_reference(reference):
+    Issue.objects.create(title="Target", status="open")
+
+    response = APIClient().post(
+        "/batch",
+        {"operations": [{"op": "add_comment", "issue": reference, "data": {"body": "Hi"}}]},
+        format="json",
+    )
+
+    assert response.status_code == 400
+    assert response.data["failed_operation"] == 0
+    assert "issue" in response.data["results"][0]["errors"]
+
+
+def test_batch_records_status_flow_once_per_status():
+    operations = [
+        {"op": "create_issue", "data": {"title": f"Issue {index}", "description": "Desc", "status": status}}
+        for index, status in enumerate(["open", "closed", "open"])
+    ]
+
+    response = APIClient().post("/batch", {"operations": operations}, format="json")
+
+    assert response.status_code == 200
+    assert dict(StatusFlow.objects.values_list("status", "created")) == {"open": 2, "closed": 1}
@@ -0,0 +1,63 @@
+import pytest
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+from core.models import Issue, Label
+
+pytestmark = pytest.mark.django_db
+
+
+def counts(facet):
+    return {row["value"]: row["count"] for row in facet}
+
+
+def test_facets_count_every_dimension():
+    client = APIClient()
+    user = User.objects.create(username="dev")
+    bug = Label.objects.create(name="bug")
+
+    Issue.objects.create(title="A", status="open", assignee=user).labels.add(bug)
+    Issue.objects.create(title="B", status="open")
+    Issue.objects.create(title="C", status="closed", assignee=user)
+
+    response = client.get("/issues/facets")
+
+    assert response.status_code == 200
+    assert counts(response.data["status"]) == {
+        "open": 2, "in_progress": 0, "resolved": 0, "closed": 1,
+    }
+    assert counts(response.data["assignee"]) == {user.id: 2, None: 1}
+    assert counts(response.data["label"]) == {"bug": 1}
+
+
+def test_facets_apply_other_dimension_filters():
+    client = APIClient()
+    user = User.objects.create(username="dev")
+
+    Issue.objects.create(title="A", status="open", assignee=user)
+    Issue.objects.create(title="B", status="open")
+    Issue.objects.create(title="C", status="closed", assignee=user)
+
+    response = client.get(f"/issues/facets?status=open&assignee={user.id}")
+
+    assert counts(response.data["status"])["open"] == 1
+    assert counts(response.data["status"])["closed"] == 1
+    assert counts(response.data["assignee"]) == {user.id: 1, None: 1}
+
+
+def test_list_filter_by_label():
+    client = APIClient()
+    bug = Label.objects.create(name="bug")
+
+    Issue.objects.create(title="Labelled", status="open").labels.add(bug)
+    Issue.objects.create(title="Plain", status="open")
+
+    response = client.get("/issues?label=bug")
+
+    assert [issue["title"] for issue in response.data["results"]] == ["Labelled"]
+
+
+def test_facets_reject_non_numeric_assignee():
+    response = APIClient().get("/issues/facets?assignee=abc")
+
+    assert response.status_code == 400
+    assert "assignee" in response.json()
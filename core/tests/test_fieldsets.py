@@ -0,0 +1,54 @@
+import pytest
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+from core.models import Comment, Issue, Label
+
+pytestmark = pytest.mark.django_db
+
+
+def test_list_fields_parameter_limits_response():
+    client = APIClient()
+
+    Issue.objects.create(title="Slim", description="x" * 5000, status="open")
+
+    response = client.get("/issues?fields=id,title,status")
+
+    assert response.status_code == 200
+    assert set(response.data["results"][0]) == {"id", "title", "status"}
+
+
+def test_list_exclude_and_expand():
+    client = APIClient()
+    author = User.objects.create(username="commenter")
+
+    issue = Issue.objects.create(title="Expanded", description="Long", status="open")
+    issue.labels.add(Label.objects.create(name="bug"))
+    Comment.objects.create(issue=issue, author=author, body="One")
+    Comment.objects.create(issue=issue, author=author, body="Two")
+
+    response = client.get("/issues?exclude=description&expand=labels,comment_count")
+
+    result = response.data["results"][0]
+    assert "description" not in result
+    assert result["comment_count"] == 2
+    assert [label["name"] for label in result["labels"]] == ["bug"]
+
+
+def test_detail_fields_parameter():
+    client = APIClient()
+
+    issue = Issue.objects.create(title="Detail", description="Long", status="open")
+
+    response = client.get(f"/issues/{issue.id}?fields=id,title")
+
+    assert response.status_code == 200
+    assert set(response.data) == {"id", "title"}
+
+
+def test_unknown_field_is_rejected():
+    client = APIClient()
+
+    response = client.get("/issues?fields=id,nope")
+
+    assert response.status_code == 400
+    assert "fields" in response.data
@@ -0,0 +1,154 @@
+import pytest
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from rest_framework.test import APIClient
+from core.models import Issue, StatusFlow
+
+pytestmark = pytest.mark.django_db
+
+
+def post_csv(client, content, **data):
+    upload = SimpleUploadedFile("issues.csv", content.encode("utf-8"))
+    return client.post("/issues/import", {"file": upload, **data}, format="multipart")
+
+
+def test_import_creates_valid_rows_and_reports_errors():
+    client = APIClient()
+    user = User.objects.create(username="importer")
+
+    response = post_csv(
+        client,
+        "title,description,status,assignee\n"
+        f"Login bug,Error,open,{user.id}\n"
+        "No assignee,Desc,open,\n"
+        "Bad status,Desc,nope,\n"
+        "Unknown user,Desc,open,999\n",
+    )
+
+    assert response.status_code == 200
+    assert response.data["total_rows"] == 4
+    assert response.data["created"] == 2
+    assert response.data["failed"] == 2
+    assert [error["row"] for error in response.data["errors"]] == [3, 4]
+    assert Issue.objects.get(title="Login bug").assignee == user
+
+
+def test_upsert_skips_unchanged_rows_and_bumps_changed_ones():
+    client = APIClient()
+    header = "external_id,title,description,status,assignee\n"
+
+    response = post_csv(
+        client,
+        header + "ext-1,First,Desc,open,\next-2,Second,Desc,open,\n",
+        mode="upsert",
+    )
+    assert response.data["created"] == 2
+
+    response = post_csv(
+        client,
+        header + "ext-1,First,Desc,open,\next-2,Second,Desc,closed,\next-3,Third,Desc,open,\n",
+        mode="upsert",
+    )
+
+    assert response.data["created"] == 1
+    assert response.data["updated"] == 1
+    assert response.data["unchanged"] == 1
+    assert Issue.objects.count() == 3
+
+    first = Issue.objects.get(external_id="ext-1")
+    second = Issue.objects.get(external_id="ext-2")
+    assert first.version == 1
+    assert second.version == 2
+    assert second.status == "closed"
+    assert list(second.changes.values_list("fields", flat=True)) == [["status"]]
+
+
+def test_upsert_restores_issues_edited_since_the_last_sync():
+    client = APIClient()
+    row = "external_id,title,description,status,assignee\next-1,First,Desc,open,\n"
+
+    post_csv(client, row, mode="upsert")
+    issue = Issue.objects.get(external_id="ext-1")
+    client.patch(f"/issues/{issue.id}", {"title": "Edited", "version": 1}, format="json")
+
+    response = post_csv(client, row, mode="upsert")
+
+    assert response.data["updated"] == 1
+    assert response.data["unchanged"] == 0
+    issue.refresh_from_db()
+    assert issue.title == "First"
+    assert issue.version == 3
+
+
+def test_upsert_requires_external_id_header():
+    client = APIClient()
+
+    response = post_csv(
+        client,
+        "title,description,status,assignee\nFirst,Desc,open,\n",
+        mode="upsert",
+    )
+
+    assert response.status_code == 400
+
+
+def test_parallel_import_matches_serial_result(settings):
+    settings.IMPORT_WORKERS = 2
+    settings.IMPORT_CHUNK_SIZE = 40
+
+    content = (
+        "title,description,status,assignee\n"
+        "First,Plain,open,\n"
+        '"Multi","line one\nline two, with comma",open,\n'
+        "Bad status,Desc,nope,\n"
+        "\n"
+        '"Quoted ""title""",Desc,closed,\n'
+        ",Missing title,open,\n"
+        "Last,Desc,resolved,\n"
+    )
+
+    serial = post_csv(APIClient(), content)
+    Issue.objects.all().delete()
+    parallel = post_csv(APIClient(), content, parallel="true")
+
+    assert parallel.status_code == 200
+    assert parallel.json() == serial.json()
+    assert serial.json()["total_rows"] == 6
+    assert Issue.objects.get(title="Multi").description == "line one\nline two, with comma"
+
+
+def test_parallel_import_of_a_single_chunk_skips_the_pool(monkeypatch):
+    from core import importing
+
+    def no_pool(workers):
+        raise AssertionError("single-chunk files should be validated inline")
+
+    monkeypatch.setattr(importing, "get_executor", no_pool)
+
+    response = post_csv(
+        APIClient(),
+        "title,description,status,assignee\nOnly,Desc,open,\n",
+        parallel="true",
+    )
+
+    assert response.status_code == 200
+    assert response.data["created"] == 1
+
+
+def test_import_records_status_flow():
+    client = APIClient()
+
+    post_csv(
+        client,
+        "external_id,title,description,status,assignee\next-1,First,Desc,open,\n",
+        mode="upsert",
+    )
+    post_csv(
+        client,
+        "external_id,title,description,status,assignee\next-1,First,Desc,resolved,\n",
+        mode="upsert",
+    )
+
+    flows = {flow.status: flow for flow in StatusFlow.objects.all()}
+    assert (flows["open"].entered, flows["open"].exited, flows["open"].created) == (1, 1, 1)
+    assert (flows["resolved"].entered, flows["resolved"].resolved) == (1, 1)
@@ -80,3 +80,62 @@ def test_latency_report_returns_200():
     client = APIClient()
     response = client.get("/reports/latency")
     assert response.status_code == 200
+
+
+def test_patch_merge_applies_non_overlapping_change():
+    client = APIClient()
+
+    issue = Issue.objects.create(title="Merge issue", status="open")
+
+    client.patch(
+        f"/issues/{issue.id}",
+        {"status": "in_progress", "version": 1},
+        format="json",
+    )
+
+    response = client.patch(
+        f"/issues/{issue.id}?merge=true",
+        {"title": "Renamed", "version": 1},
+        format="json",
+    )
+
+    assert response.status_code == 200
+    assert response.data["title"] == "Renamed"
+    assert response.data["status"] == "in_progress"
+    assert response.data["version"] == 3
+
+
+def test_patch_merge_rejects_overlapping_change():
+    client = APIClient()
+
+    issue = Issue.objects.create(title="Merge issue", status="open")
+
+    client.patch(
+        f"/issues/{issue.id}",
+        {"status": "in_progress", "version": 1},
+        format="json",
+    )
+
+    response = client.patch(
+        f"/issues/{issue.id}?merge=true",
+        {"status": "closed", "version": 1},
+        format="json",
+    )
+
+    assert response.status_code == 409
+    assert response.data["conflicting_fields"] == ["status"]
+    assert response.data["current_version"] == 2
+
+
+def test_patch_merge_rejects_when_history_is_missing():
+    client = APIClient()
+
+    issue = Issue.objects.create(title="Legacy issue", status="open", version=3)
+
+    response = client.patch(
+        f"/issues/{issue.id}?merge=true",
+        {"title": "Renamed", "version": 2},
+        format="json",
+    )
+
+    assert response.status_code == 409
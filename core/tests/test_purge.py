@@ -0,0 +1,127 @@
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from rest_framework.test import APIClient
+from core.models import Comment, Issue, Label
+
+pytestmark = pytest.mark.django_db
+
+
+def test_bulk_delete_runs_in_resumable_batches():
+    client = APIClient()
+    author = User.objects.create(username="spammer")
+    spam = Label.objects.create(name="spam")
+
+    for index in range(5):
+        issue = Issue.objects.create(title=f"Spam {index}", status="open")
+        issue.labels.add(spam)
+        Comment.objects.create(issue=issue, author=author, body="Buy now")
+    keep = Issue.objects.create(title="Real", status="open")
+
+    response = client.post(
+        "/issues/bulk-delete",
+        {"filter": {"label": "spam"}, "batch_size": 2},
+        format="json",
+    )
+    assert response.status_code == 200
+    assert response.data["processed"] == 5
+    assert response.data["done"] is True
+
+    assert list(Issue.objects.values_list("id", flat=True)) == [keep.id]
+    assert Comment.objects.count() == 0
+
+
+def test_bulk_close_bumps_versions():
+    client = APIClient()
+    issue = Issue.objects.create(title="Stale", status="open")
+
+    response = client.post(
+        "/issues/bulk-close",
+        {"filter": {"status": "open"}},
+        format="json",
+    )
+
+    assert response.status_code == 200
+    issue.refresh_from_db()
+    assert issue.status == "closed"
+    assert issue.version == 2
+    assert list(issue.changes.values_list("fields", flat=True)) == [["status"]]
+
+
+def test_bulk_delete_requires_filter():
+    client = APIClient()
+    Issue.objects.create(title="Keep", status="open")
+
+    response = client.post("/issues/bulk-delete", {"filter": {}}, format="json")
+
+    assert response.status_code == 400
+    assert Issue.objects.count() == 1
+
+
+def test_bulk_delete_skips_rows_that_stopped_matching(monkeypatch):
+    from core import purge
+
+    spam = Label.objects.create(name="spam")
+    issues = [Issue.objects.create(title=f"Spam {index}", status="open") for index in range(2)]
+    for issue in issues:
+        issue.labels.add(spam)
+
+    delete_batch = purge.PURGE_ACTIONS["delete"]
+
+    def unlabel_then_delete(queryset, ids):
+        issues[0].labels.remove(spam)
+        return delete_batch(queryset, ids)
+
+    monkeypatch.setitem(purge.PURGE_ACTIONS, "delete", unlabel_then_delete)
+
+    response = APIClient().post(
+        "/issues/bulk-delete", {"filter": {"label": "spam"}}, format="json"
+    )
+
+    assert response.data["processed"] == 1
+    assert list(Issue.objects.values_list("id", flat=True)) == [issues[0].id]
+
+
+@pytest.mark.parametrize("filters", [
+    {"updated_before": "2025-02-30"},
+    {"updated_before": 20250101},
+    {"assignee": "abc"},
+    {"status": ["open", "closed"]},
+])
+def test_bulk_delete_rejects_invalid_filter_values(filters):
+    Issue.objects.create(title="Keep", status="open")
+
+    response = APIClient().post("/issues/bulk-delete", {"filter": filters}, format="json")
+
+    assert response.status_code == 400
+    assert Issue.objects.count() == 1
+
+
+@pytest.mark.parametrize("batch_size", [0, 5001, None])
+def test_bulk_delete_rejects_out_of_range_batch_size(batch_size):
+    Issue.objects.create(title="Keep", status="open")
+
+    response = APIClient().post(
+        "/issues/bulk-delete",
+        {"filter": {"status": "open"}, "batch_size": batch_size},
+        format="json",
+    )
+
+    assert response.status_code == 400
+    assert Issue.objects.count() == 1
+
+
+def test_purge_command_rejects_invalid_date():
+    with pytest.raises(CommandError):
+        call_command("purge_issues", updated_before="2025-02-30")
+
+
+def test_purge_command_resumes_after_cursor():
+    first = Issue.objects.create(title="First", status="closed")
+    second = Issue.objects.create(title="Second", status="closed")
+
+    call_command("purge_issues", status="closed", after=first.id, batch_size=1)
+
+    assert list(Issue.objects.values_list("id", flat=True)) == [first.id]
+    assert not Issue.objects.filter(id=second.id).exists()
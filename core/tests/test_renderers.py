@@ -0,0 +1,46 @@
+import msgpack
+import pytest
+from rest_framework.test import APIClient
+from core.models import Issue
+
+pytestmark = pytest.mark.django_db
+
+
+def test_list_renders_msgpack_when_accepted():
+    client = APIClient()
+    Issue.objects.create(title="Packed", status="open")
+
+    response = client.get("/issues", HTTP_ACCEPT="application/msgpack")
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/msgpack"
+    data = msgpack.unpackb(response.content)
+    assert data["results"][0]["title"] == "Packed"
+    assert isinstance(data["results"][0]["created_at"], str)
+
+
+def test_bulk_status_accepts_msgpack_body():
+    client = APIClient()
+    issue = Issue.objects.create(title="Packed", status="open")
+
+    response = client.put(
+        "/issues/bulk-status",
+        msgpack.packb([{"id": issue.id, "status": "closed"}]),
+        content_type="application/msgpack",
+        HTTP_ACCEPT="application/msgpack",
+    )
+
+    assert response.status_code == 200
+    assert msgpack.unpackb(response.content)[0]["status"] == "closed"
+
+
+def test_invalid_msgpack_body_is_rejected():
+    client = APIClient()
+
+    response = client.put(
+        "/issues/bulk-status",
+        b"\xc1",
+        content_type="application/msgpack",
+    )
+
+    assert response.status_code == 400
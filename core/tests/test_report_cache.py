@@ -0,0 +1,84 @@
+import time
+
+import pytest
+from rest_framework.test import APIClient
+from core.models import Issue
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def inline_refresh(settings):
+    settings.REPORT_CACHE = {"TTL": 30, "MAX_STALE": 300, "BACKGROUND_REFRESH": False}
+
+
+def test_report_is_served_from_cache_until_refreshed():
+    client = APIClient()
+
+    response = client.get("/reports/top-assignees")
+    assert response["X-Report-Cache"] == "MISS"
+
+    Issue.objects.create(title="Late", status="open")
+
+    response = client.get("/reports/top-assignees")
+    assert response["X-Report-Cache"] == "HIT"
+
+    response = client.get("/reports/top-assignees?refresh=true")
+    assert response["X-Report-Cache"] == "REFRESH"
+
+
+def test_unknown_parameters_share_the_cache_entry():
+    client = APIClient()
+
+    response = client.get("/reports/top-assignees?limit=5")
+    assert response["X-Report-Cache"] == "MISS"
+
+    response = client.get("/reports/top-assignees?limit=5&_=1700000000")
+    assert response["X-Report-Cache"] == "HIT"
+
+    response = client.get("/reports/top-assignees?limit=6")
+    assert response["X-Report-Cache"] == "MISS"
+
+
+def test_stale_report_is_served_while_refreshing(monkeypatch):
+    client = APIClient()
+    client.get("/reports/latency")
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 60)
+
+    response = client.get("/reports/latency")
+    assert response["X-Report-Cache"] == "STALE"
+    assert int(response["Age"]) >= 60
+
+    response = client.get("/reports/latency")
+    assert response["X-Report-Cache"] == "HIT"
+
+
+def test_miss_waits_for_the_caller_already_computing(monkeypatch):
+    from django.core.cache import cache
+    from core import report_cache
+
+    key = report_cache.cache_key("top-assignees", {})
+    cache.add(report_cache.lock_key(key), True)
+    computed = {"data": [{"assignee": "other", "count": 1}], "computed_at": time.time()}
+    monkeypatch.setattr(report_cache.time, "sleep", lambda seconds: cache.set(key, computed))
+
+    response = APIClient().get("/reports/top-assignees")
+
+    assert response.status_code == 200
+    assert response["X-Report-Cache"] == "MISS"
+    assert response.json() == computed["data"]
+
+
+def test_miss_is_throttled_when_the_computing_caller_is_slow(settings):
+    from django.core.cache import cache
+    from core import report_cache
+
+    settings.REPORT_CACHE = {"WAIT": 0}
+    cache.add(report_cache.lock_key(report_cache.cache_key("latency", {})), True)
+
+    response = APIClient().get("/reports/latency")
+
+    assert response.status_code == 429
+    assert "Retry-After" in response
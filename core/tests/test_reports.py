@@ -0,0 +1,91 @@
+import pytest
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+from core.models import Issue
+
+pytestmark = pytest.mark.django_db
+
+
+def test_top_assignees_includes_usernames_and_status_breakdown():
+    client = APIClient()
+    alice = User.objects.create(username="alice")
+    bob = User.objects.create(username="bob")
+
+    Issue.objects.create(title="A1", status="open", assignee=alice)
+    Issue.objects.create(title="A2", status="closed", assignee=alice)
+    Issue.objects.create(title="B1", status="open", assignee=bob)
+    Issue.objects.create(title="Unassigned", status="open")
+
+    response = client.get("/reports/top-assignees")
+
+    assert response.status_code == 200
+    assert response.data[0] == {
+        "assignee": alice.id,
+        "username": "alice",
+        "issue_count": 2,
+        "by_status": {"open": 1, "in_progress": 0, "resolved": 0, "closed": 1},
+    }
+    assert response.data[1]["username"] == "bob"
+
+
+def test_top_assignees_limit_and_status_filter():
+    client = APIClient()
+    alice = User.objects.create(username="alice")
+    bob = User.objects.create(username="bob")
+
+    Issue.objects.create(title="A1", status="closed", assignee=alice)
+    Issue.objects.create(title="A2", status="closed", assignee=alice)
+    Issue.objects.create(title="B1", status="open", assignee=bob)
+
+    response = client.get("/reports/top-assignees?status=open&limit=1")
+
+    assert [row["username"] for row in response.data] == ["bob"]
+
+
+def test_top_assignees_rejects_invalid_parameters():
+    client = APIClient()
+
+    assert client.get("/reports/top-assignees?limit=0").status_code == 400
+    assert client.get("/reports/top-assignees?from=yesterday").status_code == 400
+
+
+def test_flow_report_tracks_transitions_per_day():
+    client = APIClient()
+
+    response = client.post(
+        "/issues",
+        {"title": "Flow", "description": "Desc", "status": "open"},
+        format="json",
+    )
+    issue_id = response.data["id"]
+    client.post(
+        "/issues",
+        {"title": "Other", "description": "Desc", "status": "open"},
+        format="json",
+    )
+    client.patch(
+        f"/issues/{issue_id}",
+        {"status": "in_progress", "version": 1},
+        format="json",
+    )
+    client.put(
+        "/issues/bulk-status",
+        [{"id": issue_id, "status": "resolved"}],
+        format="json",
+    )
+
+    response = client.get("/reports/flow?group_by=week")
+
+    assert response.status_code == 200
+    period = response.data["results"][-1]
+    assert period["created"] == 2
+    assert period["resolved"] == 1
+    assert period["statuses"]["open"] == {"entered": 2, "exited": 1, "total": 1}
+    assert period["statuses"]["in_progress"] == {"entered": 1, "exited": 1, "total": 0}
+    assert period["statuses"]["resolved"]["total"] == 1
+
+
+def test_flow_report_rejects_invalid_grouping():
+    client = APIClient()
+
+    assert client.get("/reports/flow?group_by=year").status_code == 400
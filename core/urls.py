@@ -1,25 +1,31 @@
 from django.urls import path
+from .lazy import lazy_view
 from .views import (
     IssueListCreateView,
+    IssueFacetsView,
     IssueRetrieveUpdateView,
     CommentCreateView,
     IssueLabelReplaceView,
     BulkIssueStatusUpdateView,
-    IssueCSVImportView,
-    TopAssigneesReportView,
-    IssueLatencyReportView,
+    BatchView,
     IssueTimelineView,
 )
 
 urlpatterns = [
     path('issues', IssueListCreateView.as_view(), name='issue-list-create'),
+    path('issues/facets', IssueFacetsView.as_view(), name='issue-facets'),
     path('issues/<int:id>', IssueRetrieveUpdateView.as_view(), name='issue-detail-update'),
     path('issues/<int:id>/comments', CommentCreateView.as_view(), name='issue-comment-create'),
     path('issues/<int:id>/labels', IssueLabelReplaceView.as_view(), name='issue-label-replace'),
     path('issues/bulk-status', BulkIssueStatusUpdateView.as_view(), name='issue-bulk-status'),
-    path('issues/import', IssueCSVImportView.as_view(), name='issue-csv-import'),
-    path('reports/top-assignees', TopAssigneesReportView.as_view(), name='report-top-assignees'),
-    path('reports/latency', IssueLatencyReportView.as_view(), name='report-latency'),
+    path('issues/bulk-delete', lazy_view('core.purge.BulkIssuePurgeView', purge_action='delete'), name='issue-bulk-delete'),
+    path('issues/bulk-close', lazy_view('core.purge.BulkIssuePurgeView', purge_action='close'), name='issue-bulk-close'),
+    path('batch', BatchView.as_view(), name='batch'),
+    path('issues/import', lazy_view('core.importing.IssueCSVImportView'), name='issue-csv-import'),
+    path('reports/top-assignees', lazy_view('core.reports.TopAssigneesReportView'), name='report-top-assignees'),
+    path('reports/latency', lazy_view('core.reports.IssueLatencyReportView'), name='report-latency'),
+    path('reports/flow', lazy_view('core.reports.FlowReportView'), name='report-flow'),
+    path('reports/concurrency', lazy_view('core.reports.ConcurrencyReportView'), name='report-concurrency'),
     path('issues/<int:id>/timeline', IssueTimelineView.as_view(), name='issue-timeline'),
 
 ]
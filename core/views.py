@@ -1,15 +1,22 @@
 from rest_framework import generics, status
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
+from django.http import Http404
 from django.db import transaction
+from django.db.models import Count
+from django.conf import settings
+from django.core.cache import cache
 from rest_framework.exceptions import ValidationError
-from .models import Issue, Label
+from rest_framework.settings import api_settings
+from .models import ArchivedIssue, Issue, IssueChange, Label
+from .archive import get_issue_or_archived, hydrate, include_archived, union_by_recency
+from . import metrics
 from .pagination import IssuePagination
-import csv
-import io
-from rest_framework.parsers import MultiPartParser, FormParser
-from django.db.models import Count, Avg, F, ExpressionWrapper, DurationField
-from django.utils.timezone import is_aware
+from .params import cache_key, query_flag
+from .filters import ISSUE_FILTERS, filter_issues, validate_issue_filters
+from .fieldsets import SparseFieldsetMixin
+from .flow import record_created, record_transitions
+from .renderers import MessagePackParser, MessagePackRenderer
 
 from .serializers import (
     IssueSerializer,
@@ -17,35 +24,136 @@ from .serializers import (
     CommentSerializer,
     LabelSerializer,
     IssueUpdateSerializer,
-    IssueCSVRowSerializer,
 )
 
 
+# Adds MessagePack next to the default renderers and parsers
+class MessagePackMixin:
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, MessagePackRenderer]
+    parser_classes = [*api_settings.DEFAULT_PARSER_CLASSES, MessagePackParser]
+
+
 # GET /issues (list with filtering & pagination) + POST /issues (create issue)
-class IssueListCreateView(generics.ListCreateAPIView):
+class IssueListCreateView(MessagePackMixin, SparseFieldsetMixin, generics.ListCreateAPIView):
     serializer_class = IssueSerializer
     pagination_class = IssuePagination
 
     def get_queryset(self):
-        queryset = Issue.objects.all().order_by('-created_at')
+        queryset = self.filter_issues(Issue.objects.all().order_by('-created_at'))
+        return self.apply_sparse_fieldset(queryset)
+
+    @transaction.atomic
+    def perform_create(self, serializer):
+        issue = serializer.save()
+        record_created(issue.status)
 
-        status_param = self.request.query_params.get("status")
-        assignee_param = self.request.query_params.get("assignee")
+    def filter_issues(self, queryset):
+        return filter_issues(queryset, self.request.query_params)
 
-        if status_param:
-            queryset = queryset.filter(status=status_param)
+    def list(self, request, *args, **kwargs):
+        if not include_archived(request.query_params):
+            return super().list(request, *args, **kwargs)
 
-        if assignee_param:
-            queryset = queryset.filter(assignee=assignee_param)
+        live = self.filter_issues(Issue.objects.all())
+        archived = self.filter_issues(ArchivedIssue.objects.all())
 
-        return queryset
+        keys = self.paginate_queryset(union_by_recency(live, archived))
+        issues = hydrate(
+            keys,
+            self.apply_sparse_fieldset(live),
+            self.apply_sparse_fieldset(archived),
+        )
+
+        serializer = self.get_serializer(issues, many=True)
+        return self.get_paginated_response(serializer.data)
+
+
+# GET /issues/facets — counts per status, assignee and label for the list filters
+class IssueFacetsView(generics.GenericAPIView):
+    queryset = Issue.objects.none()
+
+    def get(self, request):
+        params = {
+            name: request.query_params[name]
+            for name in (*ISSUE_FILTERS, "include_archived")
+            if request.query_params.get(name)
+        }
+        validate_issue_filters(params)
+
+        ttl = getattr(settings, "FACET_CACHE_TTL", 0)
+        key = cache_key("facets", params)
+
+        data = cache.get(key) if ttl else None
+        if data is None:
+            data = self.build_facets(params)
+            if ttl:
+                cache.set(key, data, timeout=ttl)
+
+        return Response(data, status=status.HTTP_200_OK)
+
+    # One grouped query per dimension. Each dimension ignores its own filter,
+    # so the counts show what selecting another value would return.
+    def build_facets(self, params):
+        querysets = [Issue.objects.all()]
+        if include_archived(params):
+            querysets.append(ArchivedIssue.objects.all())
+
+        counts = {
+            "status": dict.fromkeys(dict(Issue.STATUS_CHOICES), 0),
+            "assignee": {},
+            "label": {},
+        }
+
+        for queryset in querysets:
+            grouped = {
+                "status": (
+                    filter_issues(queryset, params, skip=("status",))
+                    .values_list("status")
+                    .annotate(count=Count("id"))
+                ),
+                "assignee": (
+                    filter_issues(queryset, params, skip=("assignee",))
+                    .values_list("assignee")
+                    .annotate(count=Count("id"))
+                ),
+                "label": (
+                    filter_issues(queryset, params, skip=("label",))
+                    .filter(labels__isnull=False)
+                    .values_list("labels__name")
+                    .annotate(count=Count("id", distinct=True))
+                ),
+            }
+            for dimension, rows in grouped.items():
+                for value, count in rows.order_by():
+                    counts[dimension][value] = counts[dimension].get(value, 0) + count
+
+        return {
+            dimension: [
+                {"value": value, "count": count}
+                for value, count in sorted(
+                    values.items(), key=lambda item: item[1], reverse=True
+                )
+            ]
+            for dimension, values in counts.items()
+        }
 
 
 # GET /issues/{id} (retrieve) + PATCH /issues/{id} (update with optimistic concurrency)
-class IssueRetrieveUpdateView(generics.RetrieveUpdateAPIView):
+class IssueRetrieveUpdateView(SparseFieldsetMixin, generics.RetrieveUpdateAPIView):
     queryset = Issue.objects.all()
     lookup_field = 'id'
 
+    def get_queryset(self):
+        return self.apply_sparse_fieldset(super().get_queryset())
+
+    # Archived issues stay readable by id
+    def get_object(self):
+        return get_issue_or_archived(
+            self.kwargs['id'],
+            self.get_queryset(),
+            self.apply_sparse_fieldset(ArchivedIssue.objects.all()),
+        )
+
     def get_serializer_class(self):
         if self.request.method == 'PATCH':
             return IssueUpdateSerializer
@@ -53,7 +161,8 @@ class IssueRetrieveUpdateView(generics.RetrieveUpdateAPIView):
 
     @transaction.atomic
     def patch(self, request, id):
-        issue = get_object_or_404(Issue, id=id)
+        issue = get_object_or_404(Issue.objects.select_for_update(), id=id)
+        merge = query_flag(request.query_params, "merge")
 
         serializer = self.get_serializer(
             issue,
@@ -70,28 +179,69 @@ class IssueRetrieveUpdateView(generics.RetrieveUpdateAPIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        serializer.validated_data.pop("version")
+        metrics.increment("issue_patch.total")
+
         if incoming_version != issue.version:
-            return Response(
-                {
+            conflicting_fields = None
+            if merge and incoming_version < issue.version:
+                conflicting_fields = self.get_conflicting_fields(
+                    issue, incoming_version, serializer.validated_data
+                )
+
+            if conflicting_fields is None or conflicting_fields:
+                metrics.increment("issue_patch.conflict")
+                body = {
                     "detail": "Version conflict. Issue has been modified by another request.",
                     "current_version": issue.version,
-                },
-                status=status.HTTP_409_CONFLICT,
-            )
+                }
+                if conflicting_fields:
+                    body["conflicting_fields"] = conflicting_fields
+                return Response(body, status=status.HTTP_409_CONFLICT)
 
-        serializer.validated_data.pop("version")
+            metrics.increment("issue_patch.merged")
+
+        changed_fields = [
+            attr for attr, value in serializer.validated_data.items()
+            if getattr(issue, attr) != value
+        ]
+
+        old_status = issue.status
 
         for attr, value in serializer.validated_data.items():
             setattr(issue, attr, value)
 
         issue.version += 1
         issue.save()
+        IssueChange.objects.create(
+            issue=issue,
+            version=issue.version,
+            fields=changed_fields,
+        )
+        record_transitions([(old_status, issue.status)])
 
         return Response(
             IssueSerializer(issue).data,
             status=status.HTTP_200_OK,
         )
 
+    # Fields touched since the client's version that the PATCH also sets.
+    # Returns None when the change history is incomplete and a merge is unsafe.
+    def get_conflicting_fields(self, issue, since_version, data):
+        changes = list(
+            issue.changes
+            .filter(version__gt=since_version)
+            .values_list("fields", flat=True)
+        )
+        if len(changes) != issue.version - since_version:
+            return None
+
+        touched = set()
+        for fields in changes:
+            touched.update(fields)
+
+        return sorted(touched.intersection(data))
+
 
 # POST /issues/{id}/comments — add a comment to an issue
 class CommentCreateView(generics.CreateAPIView):
@@ -130,7 +280,7 @@ class IssueLabelReplaceView(generics.GenericAPIView):
 
 
 # PUT /issues/bulk-status — transactional bulk status update
-class BulkIssueStatusUpdateView(generics.GenericAPIView):
+class BulkIssueStatusUpdateView(MessagePackMixin, generics.GenericAPIView):
     queryset = Issue.objects.all()
     serializer_class = IssueSerializer
 
@@ -143,6 +293,7 @@ class BulkIssueStatusUpdateView(generics.GenericAPIView):
             )
 
         updated_issues = []
+        transitions = []
 
         for item in request.data:
             issue_id = item.get("id")
@@ -154,7 +305,7 @@ class BulkIssueStatusUpdateView(generics.GenericAPIView):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            issue = get_object_or_404(Issue, id=issue_id)
+            issue = get_object_or_404(Issue.objects.select_for_update(), id=issue_id)
 
             if new_status not in dict(Issue.STATUS_CHOICES):
                 return Response(
@@ -162,123 +313,178 @@ class BulkIssueStatusUpdateView(generics.GenericAPIView):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
+            changed_fields = ["status"] if issue.status != new_status else []
+            transitions.append((issue.status, new_status))
+
             issue.status = new_status
             issue.version += 1
-            issue.save()
+            issue.save(update_fields=["status", "version", "updated_at"])
+            IssueChange.objects.create(
+                issue=issue,
+                version=issue.version,
+                fields=changed_fields,
+            )
 
             updated_issues.append(issue)
 
+        record_transitions(transitions)
+
         return Response(
             IssueSerializer(updated_issues, many=True).data,
             status=status.HTTP_200_OK,
         )
 
 
-# POST /issues/import — CSV import with per-row validation and partial success
-class IssueCSVImportView(generics.GenericAPIView):
-    serializer_class = IssueCSVRowSerializer
-    parser_classes = (MultiPartParser, FormParser)
+# POST /batch — ordered sub-operations executed in a single transaction
+class BatchView(MessagePackMixin, generics.GenericAPIView):
+    queryset = Issue.objects.none()
+    max_operations = 100
 
     def post(self, request):
-        file = request.FILES.get("file")
+        operations = request.data.get("operations") if isinstance(request.data, dict) else None
 
-        if not file:
+        if not isinstance(operations, list) or not operations:
             return Response(
-                {"detail": "CSV file is required."},
+                {"detail": "Expected a non-empty list of operations."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        if not file.name.endswith(".csv"):
+        if len(operations) > self.max_operations:
             return Response(
-                {"detail": "Only CSV files are allowed."},
+                {"detail": f"A batch may contain at most {self.max_operations} operations."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        decoded_file = file.read().decode("utf-8")
-        io_string = io.StringIO(decoded_file)
-        reader = csv.DictReader(io_string)
+        handlers = {
+            "create_issue": self.create_issue,
+            "replace_labels": self.replace_labels,
+            "add_comment": self.add_comment,
+        }
+
+        self.refs = {}
+        self.issues = {}
+        self.transitions = []
+        results = []
+
+        with transaction.atomic():
+            self.labels = self.preload_labels(operations)
+
+            for index, operation in enumerate(operations):
+                op = operation.get("op") if isinstance(operation, dict) else None
+
+                try:
+                    if op not in handlers:
+                        raise ValidationError(
+                            {"op": [f"Unsupported operation '{op}'."]}
+                        )
+                    status_code, data = handlers[op](operation)
+                except ValidationError as exc:
+                    status_code, errors = exc.status_code, exc.detail
+                except Http404:
+                    status_code, errors = status.HTTP_404_NOT_FOUND, {"detail": "Not found."}
+                else:
+                    result = {"index": index, "op": op, "status": status_code, "data": data}
+                    if operation.get("ref"):
+                        result["ref"] = operation["ref"]
+                    results.append(result)
+                    continue
+
+                transaction.set_rollback(True)
+                results.append({
+                    "index": index,
+                    "op": op,
+                    "status": status_code,
+                    "errors": errors,
+                })
+                return Response(
+                    {"failed_operation": index, "results": results},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
 
-        required_fields = {"title", "description", "status", "assignee"}
-        if not required_fields.issubset(reader.fieldnames):
-            return Response(
-                {
-                    "detail": "CSV must contain headers: title, description, status, assignee"
-                },
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+            # Flow rows are hot; update them once, last, so their locks are
+            # held only until commit and taken in a consistent order.
+            record_transitions(self.transitions)
+
+        return Response({"results": results}, status=status.HTTP_200_OK)
+
+    # One query for every label named anywhere in the batch
+    def preload_labels(self, operations):
+        names = set()
+        for operation in operations:
+            if isinstance(operation, dict) and operation.get("op") == "replace_labels":
+                data = operation.get("data")
+                for item in data if isinstance(data, list) else []:
+                    if isinstance(item, dict) and isinstance(item.get("name"), str):
+                        names.add(item["name"].strip())
+
+        return {label.name: label for label in Label.objects.filter(name__in=names)}
 
-        total_rows = 0
-        created = 0
-        failed = 0
-        errors = []
-
-        for index, row in enumerate(reader, start=1):
-            total_rows += 1
-
-            serializer = IssueCSVRowSerializer(data=row)
-            if serializer.is_valid():
-                Issue.objects.create(**serializer.validated_data)
-                created += 1
-            else:
-                failed += 1
-                errors.append(
-                    {
-                        "row": index,
-                        "errors": serializer.errors,
-                    }
+    def resolve_issue(self, operation):
+        reference = operation.get("issue")
+
+        if isinstance(reference, str) and reference.startswith("$"):
+            issue = self.refs.get(reference[1:])
+            if issue is None:
+                raise ValidationError(
+                    {"issue": [f"Unknown reference '{reference}'."]}
                 )
+            return issue
+
+        if isinstance(reference, bool) or not (
+            isinstance(reference, int)
+            or (isinstance(reference, str) and reference.isdigit())
+        ):
+            raise ValidationError(
+                {"issue": ["Expected an issue id or a '$ref' to an earlier operation."]}
+            )
 
-        return Response(
-            {
-                "total_rows": total_rows,
-                "created": created,
-                "failed": failed,
-                "errors": errors,
-            },
-            status=status.HTTP_200_OK,
-        )
+        issue_id = int(reference)
+        if issue_id not in self.issues:
+            self.issues[issue_id] = get_object_or_404(Issue, id=issue_id)
 
+        return self.issues[issue_id]
 
-# GET /reports/top-assignees — aggregate issues by assignee
-class TopAssigneesReportView(generics.GenericAPIView):
-    queryset = Issue.objects.none()
+    def create_issue(self, operation):
+        ref = operation.get("ref")
+        if ref is not None and (not isinstance(ref, str) or not ref or ref in self.refs):
+            raise ValidationError({"ref": ["Reference must be a unique, non-empty string."]})
 
-    def get(self, request):
-        data = (
-            Issue.objects
-            .exclude(assignee__isnull=True)
-            .values("assignee")
-            .annotate(issue_count=Count("id"))
-            .order_by("-issue_count")
-        )
+        serializer = IssueSerializer(data=operation.get("data") or {})
+        serializer.is_valid(raise_exception=True)
+        issue = serializer.save()
+        self.transitions.append((None, issue.status))
 
-        return Response(list(data), status=status.HTTP_200_OK)
+        self.issues[issue.id] = issue
+        if ref:
+            self.refs[ref] = issue
 
+        return status.HTTP_201_CREATED, serializer.data
 
-# GET /reports/latency — average resolution time for resolved/closed issues
-class IssueLatencyReportView(generics.GenericAPIView):
-    queryset = Issue.objects.none()
+    def replace_labels(self, operation):
+        issue = self.resolve_issue(operation)
 
-    def get(self, request):
-        resolved_issues = Issue.objects.filter(
-            status__in=["resolved", "closed"]
-        )
+        serializer = LabelSerializer(data=operation.get("data"), many=True)
+        serializer.is_valid(raise_exception=True)
 
-        latency_expression = ExpressionWrapper(
-            F("updated_at") - F("created_at"),
-            output_field=DurationField()
-        )
+        labels = []
+        for label_data in serializer.validated_data:
+            name = label_data["name"]
+            if name not in self.labels:
+                self.labels[name], _ = Label.objects.get_or_create(name=name)
+            labels.append(self.labels[name])
 
-        result = resolved_issues.aggregate(
-            average_latency=Avg(latency_expression)
-        )
+        issue.labels.set(labels)
 
-        return Response(
-            {
-                "average_resolution_time": result["average_latency"]
-            },
-            status=status.HTTP_200_OK,
-        )
+        return status.HTTP_200_OK, LabelSerializer(labels, many=True).data
+
+    def add_comment(self, operation):
+        issue = self.resolve_issue(operation)
+
+        serializer = CommentSerializer(data=operation.get("data") or {})
+        serializer.is_valid(raise_exception=True)
+        serializer.save(issue=issue)
+
+        return status.HTTP_201_CREATED, serializer.data
 
 
 # GET /issues/{id}/timeline — derived timeline of issue history (bonus)
@@ -287,7 +493,7 @@ class IssueTimelineView(generics.GenericAPIView):
     lookup_field = 'id'
 
     def get(self, request, id):
-        issue = get_object_or_404(Issue, id=id)
+        issue = get_issue_or_archived(id)
 
         events = []
 
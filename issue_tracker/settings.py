@@ -31,7 +31,9 @@ SECRET_KEY = os.environ.get("SECRET_KEY")
 DEBUG = os.environ.get("DEBUG") == "True"
 
 
-ALLOWED_HOSTS = []
+ALLOWED_HOSTS = [
+    host for host in os.environ.get("ALLOWED_HOSTS", "").split(",") if host
+]
 
 
 # Application definition
@@ -134,9 +136,37 @@ STATIC_URL = "static/"
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
-REST_FRAMEWORK = {
-    'DEFAULT_RENDERER_CLASSES': (
+
+# Renderer profiles: production skips the browsable API and its template stack
+RENDERER_PROFILES = {
+    "production": (
+        'rest_framework.renderers.JSONRenderer',
+    ),
+    "development": (
         'rest_framework.renderers.JSONRenderer',
         'rest_framework.renderers.BrowsableAPIRenderer',
     ),
 }
+
+API_RENDERER_PROFILE = os.environ.get(
+    "API_RENDERER_PROFILE", "development" if DEBUG else "production"
+)
+
+REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': RENDERER_PROFILES[API_RENDERER_PROFILE],
+}
+
+# Stale-while-revalidate cache for report endpoints (seconds)
+REPORT_CACHE = {
+    "TTL": int(os.environ.get("REPORT_CACHE_TTL", 30)),
+    "MAX_STALE": int(os.environ.get("REPORT_CACHE_MAX_STALE", 300)),
+    "WORKERS": int(os.environ.get("REPORT_CACHE_WORKERS", 2)),
+    "BACKGROUND_REFRESH": True,
+}
+
+# Seconds to cache facet counts per filter set; 0 disables caching
+FACET_CACHE_TTL = int(os.environ.get("FACET_CACHE_TTL", 0))
+
+# Parallel CSV import (POST /issues/import with parallel=true)
+IMPORT_WORKERS = int(os.environ["IMPORT_WORKERS"]) if os.environ.get("IMPORT_WORKERS") else None
+IMPORT_CHUNK_SIZE = int(os.environ.get("IMPORT_CHUNK_SIZE", 1024 * 1024))